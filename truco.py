@@ -9,6 +9,9 @@ import random
 import os
 import time
 import sys
+from collections import Counter
+from itertools import combinations
+from enum import IntEnum
 from typing import List, Tuple, Dict, Optional, Any
 
 # ============== CONFIGURATION ===============
@@ -25,12 +28,115 @@ ROUNDS_PER_HAND = 3
 
 # ============== CARD MODELS ===============
 
+_SUITS = ('Espadas', 'Bastos', 'Oros', 'Copas')
+_RANKS = ('1', '2', '3', '4', '5', '6', '7', 'Sota', 'Caballo', 'Rey')
+
+_SUIT_SYMBOLS = {
+    'Espadas': '🗡️', # Sword for Espadas
+    'Bastos': '🏑',  # Hockey stick for Bastos (club/baton)
+    'Oros': '🪙',    # Gold coin for Oros
+    'Copas': '🏆'    # Trophy/cup for Copas
+}
+
+_FACE_RANK_DISPLAY = {'Sota': 'J', 'Caballo': 'C', 'Rey': 'R'}
+
+_SUIT_IDS = {suit: i for i, suit in enumerate(_SUITS)}
+
+
+def _strength_for(suit, rank):
+    """Returns a description of a card's strength in Truco with emojis"""
+    # Top 4 cards
+    if suit == 'Espadas' and rank == '1':
+        return "⭐⭐⭐ Strongest card"
+    elif suit == 'Bastos' and rank == '1':
+        return "⭐⭐ 2nd strongest"
+    elif suit == 'Espadas' and rank == '7':
+        return "⭐ 3rd strongest"
+    elif suit == 'Oros' and rank == '7':
+        return "✨ 4th strongest"
+    # Card types
+    elif rank == '3':
+        return "💪 Very strong"
+    elif rank == '2':
+        return "👍 Strong"
+    elif rank == '1':
+        return "👌 Good"
+    elif rank in ['Rey', 'Caballo', 'Sota']:
+        return "➖ Medium"
+    elif rank == '7':
+        return "🔽 Weak-Medium"
+    else:
+        return "👎 Weak"
+
+
+# (suit, rank) -> strength description, evaluated once for all 40 cards
+_STRENGTH_TABLE = {(suit, rank): _strength_for(suit, rank) for suit in _SUITS for rank in _RANKS}
+
+
+def _description_for(suit, rank):
+    """Returns a detailed description of the card including its relative strength"""
+    # Special named cards first
+    if suit == 'Espadas' and rank == '1':
+        return "1 of Espadas (🗡️) - The BEST card in the game! This is the anchor of any good hand."
+    elif suit == 'Bastos' and rank == '1':
+        return "1 of Bastos (🏑) - The 2nd best card. Very powerful and worth keeping."
+    elif suit == 'Espadas' and rank == '7':
+        return "7 of Espadas (🗡️) - The 3rd best card. Much stronger than other 7s!"
+    elif suit == 'Oros' and rank == '7':
+        return "7 of Oros (🪙) - The 4th best card. Special among 7s!"
+    
+    # Card categories
+    elif rank == '3':
+        return f"3 of {suit} - Very strong card (5th-8th best in game)"
+    elif rank == '2':
+        return f"2 of {suit} - Strong card (9th-12th best in game)"
+    elif rank == '1' and suit in ['Oros', 'Copas']:
+        return f"1 of {suit} - Good card (13th-14th best in game)"
+    elif rank == 'Rey':
+        return f"Rey (King) of {suit} - Medium strength (15th-18th best)"
+    elif rank == 'Caballo':
+        return f"Caballo (Knight) of {suit} - Medium strength (19th-22nd best)"
+    elif rank == 'Sota':
+        return f"Sota (Jack) of {suit} - Medium strength (23rd-26th best)"
+    elif rank == '7' and suit in ['Bastos', 'Copas']:
+        return f"7 of {suit} - Weak-Medium strength (27th-28th best)"
+    elif rank == '6':
+        return f"6 of {suit} - Weak card (29th-32nd best)"
+    elif rank == '5':
+        return f"5 of {suit} - Weak card (33rd-36th best)"
+    elif rank == '4':
+        return f"4 of {suit} - Weakest card (37th-40th in rank)"
+    else:
+        return f"{rank} of {suit}"
+
+
+# (suit, rank) -> detailed description, evaluated once for all 40 cards
+_DESCRIPTION_TABLE = {(suit, rank): _description_for(suit, rank) for suit in _SUITS for rank in _RANKS}
+
+
 class Card:
-    def __init__(self, suit, rank, value):
-        self.suit = suit
-        self.rank = rank
+    __slots__ = ('suit', 'rank', 'value', 'display', 'strength_desc', 'suit_id', 'envido_value', 'is_strong', 'mask')
+    
+    def __init__(self, suit, rank, value, card_id=None):
+        # Interned so the (suit, rank) table lookups hit the identity fast path before comparing strings
+        self.suit = sys.intern(suit)
+        self.rank = sys.intern(rank)
         self.value = value  # Truco specific value (for ranking)
         
+        # Display strings never change, so render them once
+        self.display = f"{_FACE_RANK_DISPLAY.get(rank, rank)}{_SUIT_SYMBOLS[suit]}"
+        self.strength_desc = _STRENGTH_TABLE[(suit, rank)]
+        
+        # Envido inputs: face cards count 0, cards 1-7 count their face value
+        self.suit_id = _SUIT_IDS[suit]
+        self.envido_value = 0 if rank in _FACE_RANK_DISPLAY else int(rank)
+        
+        # Top cards and strong number cards
+        self.is_strong = value >= 10 or rank in ('1', '2', '3')
+        
+        # One bit per deck position, so a hand's bits OR together into a unique key
+        self.mask = 1 << card_id if card_id is not None else 0
+        
     def __str__(self):
         return f"{self.rank} of {self.suit}"
     
@@ -39,133 +145,103 @@ class Card:
     
     def get_display(self):
         """Returns a display-friendly representation of the card with Spanish deck symbols"""
-        suit_symbols = {
-            'Espadas': '🗡️', # Sword for Espadas
-            'Bastos': '🏑',  # Hockey stick for Bastos (club/baton)
-            'Oros': '🪙',    # Gold coin for Oros
-            'Copas': '🏆'    # Trophy/cup for Copas
-        }
-        
-        # Handle numeric and face cards
-        if self.rank in ['Sota', 'Caballo', 'Rey']:
-            rank_display = {'Sota': 'J', 'Caballo': 'C', 'Rey': 'R'}[self.rank]
-        else:
-            rank_display = self.rank
-            
-        return f"{rank_display}{suit_symbols[self.suit]}"
+        return self.display
     
     def get_envido_value(self):
         """Returns the value of this card for Envido calculations"""
-        if self.rank in ['Sota', 'Caballo', 'Rey']:
-            return 0
-        else:
-            return int(self.rank)  # For cards 1-7, the value is the face value
+        return self.envido_value
             
     def get_detailed_description(self):
         """Returns a detailed description of the card including its relative strength"""
-        # Special named cards first
-        if self.suit == 'Espadas' and self.rank == '1':
-            return "1 of Espadas (🗡️) - The BEST card in the game! This is the anchor of any good hand."
-        elif self.suit == 'Bastos' and self.rank == '1':
-            return "1 of Bastos (🏑) - The 2nd best card. Very powerful and worth keeping."
-        elif self.suit == 'Espadas' and self.rank == '7':
-            return "7 of Espadas (🗡️) - The 3rd best card. Much stronger than other 7s!"
-        elif self.suit == 'Oros' and self.rank == '7':
-            return "7 of Oros (🪙) - The 4th best card. Special among 7s!"
-        
-        # Card categories
-        elif self.rank == '3':
-            return f"3 of {self.suit} - Very strong card (5th-8th best in game)"
-        elif self.rank == '2':
-            return f"2 of {self.suit} - Strong card (9th-12th best in game)"
-        elif self.rank == '1' and self.suit in ['Oros', 'Copas']:
-            return f"1 of {self.suit} - Good card (13th-14th best in game)"
-        elif self.rank == 'Rey':
-            return f"Rey (King) of {self.suit} - Medium strength (15th-18th best)"
-        elif self.rank == 'Caballo':
-            return f"Caballo (Knight) of {self.suit} - Medium strength (19th-22nd best)"
-        elif self.rank == 'Sota':
-            return f"Sota (Jack) of {self.suit} - Medium strength (23rd-26th best)"
-        elif self.rank == '7' and self.suit in ['Bastos', 'Copas']:
-            return f"7 of {self.suit} - Weak-Medium strength (27th-28th best)"
-        elif self.rank == '6':
-            return f"6 of {self.suit} - Weak card (29th-32nd best)"
-        elif self.rank == '5':
-            return f"5 of {self.suit} - Weak card (33rd-36th best)"
-        elif self.rank == '4':
-            return f"4 of {self.suit} - Weakest card (37th-40th in rank)"
+        return _DESCRIPTION_TABLE[(self.suit, self.rank)]
+
+
+def _envido_points(cards):
+    """Envido points for a set of cards, in a single pass.
+    
+    Two or more cards of one suit score 20 plus the two highest Envido
+    values of that suit; otherwise the hand scores its highest card.
+    """
+    suit_best = [-1, -1, -1, -1]  # Highest Envido value seen so far per suit
+    pair_points = -1
+    highest = 0
+    for card in cards:
+        value = card.envido_value
+        if value > highest:
+            highest = value
+        suit_id = card.suit_id
+        best = suit_best[suit_id]
+        if best < 0:
+            suit_best[suit_id] = value
         else:
-            return f"{self.rank} of {self.suit}"
+            if 20 + best + value > pair_points:
+                pair_points = 20 + best + value
+            if value > best:
+                suit_best[suit_id] = value
+    return pair_points if pair_points >= 0 else highest
+
+
+# Truco uses a special ranking of cards
+# The ranking from highest to lowest is:
+# 1 of Espadas, 1 of Bastos, 7 of Espadas, 7 of Oros
+# 3s, 2s, 1s (except the 1 of Espadas and 1 of Bastos), 
+# Rey (King), Caballo (Knight), Sota (Jack), 7s (except 7 of Espadas and 7 of Oros),
+# 6s, 5s, 4s
+
+_RANK_VALUES = {
+    '3': 10,  # All 3s
+    '2': 9,   # All 2s
+    '1': 8,   # Regular 1s (not Espadas or Bastos)
+    'Rey': 7,
+    'Caballo': 6,
+    'Sota': 5,
+    '7': 4,   # Regular 7s (not Espadas or Oros)
+    '6': 3,
+    '5': 2,
+    '4': 1,
+}
+
+_SPECIAL_CARD_VALUES = {
+    ('Espadas', '1'): 14,  # Highest card
+    ('Bastos', '1'): 13,
+    ('Espadas', '7'): 12,
+    ('Oros', '7'): 11
+}
+
+# (suit, rank) -> Truco value for all 40 cards, in deck order
+_TRUCO_VALUES = {
+    (suit, rank): _SPECIAL_CARD_VALUES.get((suit, rank), _RANK_VALUES[rank])
+    for suit in _SUITS
+    for rank in _RANKS
+}
+
+
+def _build_deck():
+    """Creates a Spanish deck (40 cards) with Truco-specific values"""
+    return [Card(suit, rank, value, i) for i, ((suit, rank), value) in enumerate(_TRUCO_VALUES.items())]
+
+
+# Cards are never mutated during play, so every game's card pool shares these instances
+_PROTOTYPE_DECK = tuple(_build_deck())
+
+# Envido points of every possible 3-card hand (C(40,3) = 9880), keyed by the OR of the card masks
+_ENVIDO_TABLE = {
+    a.mask | b.mask | c.mask: _envido_points((a, b, c))
+    for a, b, c in combinations(_PROTOTYPE_DECK, 3)
+}
+
+
+def _partial_shuffle(cards, k, rng=random):
+    """Shuffle a uniformly random selection of k cards into the front of the list, in place"""
+    n = len(cards)
+    for i in range(k):
+        j = rng.randrange(i, n)
+        cards[i], cards[j] = cards[j], cards[i]
 
 
 class Deck:
-    def __init__(self):
-        self.cards = []
-        self.create_truco_deck()
-        
-    def create_truco_deck(self):
-        """Creates a Spanish deck (40 cards) with Truco-specific values"""
-        suits = ['Espadas', 'Bastos', 'Oros', 'Copas']
-        
-        # Truco uses a special ranking of cards
-        # The ranking from highest to lowest is:
-        # 1 of Espadas, 1 of Bastos, 7 of Espadas, 7 of Oros
-        # 3s, 2s, 1s (except the 1 of Espadas and 1 of Bastos), 
-        # Rey (King), Caballo (Knight), Sota (Jack), 7s (except 7 of Espadas and 7 of Oros),
-        # 6s, 5s, 4s
-        
-        # We'll assign a value to each card for easy comparison
-        special_cards = {
-            ('Espadas', '1'): 14,  # Highest card
-            ('Bastos', '1'): 13,
-            ('Espadas', '7'): 12,
-            ('Oros', '7'): 11
-        }
-        
-        # Add all cards with their Truco values
-        for suit in suits:
-            # Add numbered cards 1-7
-            for rank in range(1, 8):
-                rank_str = str(rank)
-                
-                # Check if it's a special card
-                if (suit, rank_str) in special_cards:
-                    value = special_cards[(suit, rank_str)]
-                elif rank == 3:
-                    value = 10  # All 3s
-                elif rank == 2:
-                    value = 9   # All 2s
-                elif rank == 1:  # Regular 1s (not Espadas or Bastos)
-                    value = 8
-                elif rank == 7:  # Regular 7s (not Espadas or Oros)
-                    value = 4
-                elif rank == 6:
-                    value = 3
-                elif rank == 5:
-                    value = 2
-                elif rank == 4:
-                    value = 1
-                else:
-                    value = 0
-                
-                self.cards.append(Card(suit, rank_str, value))
-            
-            # Add face cards (Sota, Caballo, Rey)
-            for rank, value in [('Sota', 5), ('Caballo', 6), ('Rey', 7)]:
-                self.cards.append(Card(suit, rank, value))
+    """Card ranking references; games deal from their own pool of the _PROTOTYPE_DECK cards"""
     
-    def shuffle(self):
-        random.shuffle(self.cards)
-        
-    def deal(self, num_cards):
-        """Deal a specific number of cards from the deck"""
-        if len(self.cards) < num_cards:
-            return []
-        
-        dealt_cards = self.cards[:num_cards]
-        self.cards = self.cards[num_cards:]
-        return dealt_cards
-        
     @staticmethod
     def get_card_rank_explanation():
         """Returns a detailed explanation of card ranking in Truco"""
@@ -218,56 +294,56 @@ class Deck:
 # ============== PLAYER MODELS ===============
 
 class Player:
+    __slots__ = ('name', 'is_human', 'hand', 'hand_values', 'envido_points', '_hand_display', 'team', 'personality')
+    
     def __init__(self, name, is_human=False, personality="normal"):
         self.name = name
         self.is_human = is_human
         self.hand = []
+        self.hand_values = []  # Truco values of the cards in hand, kept in step with hand
+        self.envido_points = 0  # Envido points of the hand as dealt
+        self._hand_display = None  # Cached get_hand_display() lines, reset when the hand changes
         self.team = None
         self.personality = personality  # Could be "aggressive", "cautious", "bluffer", etc.
         
+    def clear_hand(self):
+        self.hand = []
+        self.hand_values = []
+        self.envido_points = 0
+        self._hand_display = None
+        
     def add_cards(self, cards):
         self.hand.extend(cards)
+        self.hand_values.extend(card.value for card in cards)
+        # Envido is settled before any card is played, so score the hand once here
+        envido_points = None
+        if len(self.hand) == 3:
+            first, second, third = self.hand
+            envido_points = _ENVIDO_TABLE.get(first.mask | second.mask | third.mask)
+        self.envido_points = envido_points if envido_points is not None else _envido_points(self.hand)
+        self._hand_display = None
         
     def play_card(self, card_index):
         if 0 <= card_index < len(self.hand):
+            self.hand_values.pop(card_index)
+            self._hand_display = None
             return self.hand.pop(card_index)
         return None
     
     def get_hand_display(self):
         """Returns a formatted display of cards in hand with indices"""
-        display = []
-        for i, card in enumerate(self.hand):
-            display.append(f"{i+1}: {card.get_display()} ({CardUtils.get_card_strength_description(card)})")
-        return display
+        if self._hand_display is None:
+            self._hand_display = [f"{i+1}: {card.display} ({card.strength_desc})" for i, card in enumerate(self.hand)]
+        return list(self._hand_display)
     
     def calculate_envido_points(self) -> int:
         """Calculate the Envido points for this player's hand"""
-        if not self.hand:
-            return 0
-            
-        # Group cards by suit
-        cards_by_suit = {}
-        for card in self.hand:
-            if card.suit not in cards_by_suit:
-                cards_by_suit[card.suit] = []
-            cards_by_suit[card.suit].append(card)
-        
-        # Find the suit with the most cards
-        best_suit = max(cards_by_suit.items(), key=lambda x: len(x[1]))[0]
-        cards_in_best_suit = cards_by_suit[best_suit]
-        
-        # If we have at least 2 cards of the same suit
-        if len(cards_in_best_suit) >= 2:
-            # Sort by Envido value (descending)
-            cards_in_best_suit.sort(key=lambda c: c.get_envido_value(), reverse=True)
-            # Base 20 points + the two highest cards
-            return 20 + cards_in_best_suit[0].get_envido_value() + cards_in_best_suit[1].get_envido_value()
-        # If we only have one card of each suit, return the highest card value
-        else:
-            return max(card.get_envido_value() for card in self.hand)
+        return _envido_points(self.hand)
 
 
 class Team:
+    __slots__ = ('name', 'players', 'score', 'human_players', 'ai_players', 'first_human', 'first_ai')
+    
     def __init__(self, name, players):
         self.name = name
         self.players = players
@@ -276,6 +352,14 @@ class Team:
         # Assign this team to all players
         for player in players:
             player.team = self
+        
+        # Team membership is fixed, so split it by controller once
+        self.human_players = [p for p in players if p.is_human]
+        self.ai_players = [p for p in players if not p.is_human]
+        
+        # Who speaks for the team in comments and bet responses
+        self.first_human = self.human_players[0] if self.human_players else None
+        self.first_ai = self.ai_players[0] if self.ai_players else None
 
     def add_score(self, points):
         self.score += points
@@ -294,28 +378,7 @@ class CardUtils:
     @staticmethod
     def get_card_strength_description(card):
         """Returns a description of the card's strength in Truco with emojis"""
-        # Top 4 cards
-        if card.suit == 'Espadas' and card.rank == '1':
-            return "⭐⭐⭐ Strongest card"
-        elif card.suit == 'Bastos' and card.rank == '1':
-            return "⭐⭐ 2nd strongest"
-        elif card.suit == 'Espadas' and card.rank == '7':
-            return "⭐ 3rd strongest"
-        elif card.suit == 'Oros' and card.rank == '7':
-            return "✨ 4th strongest"
-        # Card types
-        elif card.rank == '3':
-            return "💪 Very strong"
-        elif card.rank == '2':
-            return "👍 Strong"
-        elif card.rank == '1':
-            return "👌 Good"
-        elif card.rank in ['Rey', 'Caballo', 'Sota']:
-            return "➖ Medium"
-        elif card.rank == '7':
-            return "🔽 Weak-Medium"
-        else:
-            return "👎 Weak"
+        return card.strength_desc
             
     @staticmethod
     def get_card_value_emoji(value):
@@ -350,8 +413,65 @@ class CardUtils:
             return "▪️"  # Black medium small square
 
 
+class InputUtils:
+    @staticmethod
+    def read_line(prompt=""):
+        """Read one line from the player, without surrounding whitespace.
+        
+        Every prompt in the game reads through here, so input handling only
+        has to change in one place.
+        """
+        return input(prompt).strip()
+    
+    @staticmethod
+    def prompt_int(prompt, low, high, default, display_manager):
+        """Ask until the player enters a number from low to high and return it.
+        
+        Empty input, or the end of input when stdin is piped or closed,
+        returns default instead. Error messages go through display_manager,
+        so a quiet one keeps them quiet.
+        """
+        while True:
+            try:
+                choice = InputUtils.read_line(prompt)
+            except EOFError:
+                return default
+            if not choice:
+                return default
+            try:
+                value = int(choice)
+            except ValueError:
+                display_manager.emit("❌ Please enter a valid number.")
+                continue
+            if low <= value <= high:
+                return value
+            display_manager.emit("❌ Invalid choice. Please try again.")
+
+
 # ============== ENHANCED DISPLAY SYSTEM ===============
 
+_TIE_MESSAGES = (
+    "🔄 It's a tie! The cards are perfectly matched! 🔄",
+    "⚖️ Balance of power - this round is tied! ⚖️",
+    "🤝 Both sides equally matched - it's a tie! 🤝",
+    "📏 Too close to call - this round ends in a tie! 📏",
+)
+
+# Celebration templates, filled in with the team name and points when shown
+_HAND_WIN_CELEBRATIONS = (
+    "🎉 {team_name} wins the hand and scores {points} point(s)! 🎉",
+    "🏆 Impressive victory for {team_name}! +{points} point(s) 🏆",
+    "💯 {team_name} takes the hand! {points} point(s) awarded! 💯",
+    "🌟 Well played by {team_name}! They get {points} point(s)! 🌟",
+)
+_ROUND_WIN_CELEBRATIONS = (
+    "✨ {team_name} takes the round! ✨",
+    "👏 Nice play by {team_name}! 👏",
+    "🔥 {team_name} is on fire! 🔥",
+    "💪 Strong move by {team_name}! 💪",
+)
+
+
 class TerminalColors:
     # ANSI color codes
     RESET = "\033[0m"
@@ -403,18 +523,43 @@ class TerminalColors:
 
 
 class DisplayManager:
-    def __init__(self, screen_width=SCREEN_WIDTH):
+    _ansi_enabled = False  # Set once the Windows console accepts ANSI escapes
+    
+    def __init__(self, screen_width=SCREEN_WIDTH, quiet=False, rng=random, interactive=True):
         self.screen_width = screen_width
+        self.quiet = quiet  # Suppress all terminal output (for AI simulations)
+        self.interactive = interactive  # Wait for Enter and pause between plays
+        self.rng = rng  # Picks the celebration and tie messages
         self.history = []  # Keep a history of important events
         self.max_history = 10  # Maximum number of history items to display
         self.last_section = None  # Track the last displayed section
+        self._separators = {}  # (char, title, color) -> rendered separator
+        self._card_formats = {}  # (card, show_strength) -> rendered card
         
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self.quiet:
+            return
+        if os.name == 'nt' and not DisplayManager._ansi_enabled:
+            os.system('')  # Switches the Windows console into ANSI escape mode
+            DisplayManager._ansi_enabled = True
+        # Erase the screen and home the cursor with one write instead of spawning a shell
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.flush()
+    
+    def emit(self, *lines):
+        """Write several lines to the terminal with a single write call"""
+        if self.quiet:
+            return
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def create_separator(self, char="═", title=None, color=None):
         """Create a separator line with optional title"""
+        key = (char, title, color)
+        separator = self._separators.get(key)
+        if separator is not None:
+            return separator
+        
         if title:
             title_str = f" {title} "
             half_width = (self.screen_width - len(title_str)) // 2
@@ -424,7 +569,8 @@ class DisplayManager:
             
         if color and ENABLE_COLORS:
             separator = TerminalColors.colorize(separator, color)
-            
+        
+        self._separators[key] = separator
         return separator
     
     def section(self, title, end_separator=True, color=None):
@@ -435,7 +581,7 @@ class DisplayManager:
             color = TerminalColors.BRIGHT_CYAN
             
         separator = self.create_separator(title=title, color=color)
-        print("\n" + separator)
+        self.emit("\n" + separator)
         
         if end_separator:
             return separator  # Return the separator for the caller to use as end separator
@@ -445,13 +591,19 @@ class DisplayManager:
         """Format a card with optional colorization"""
         if not card:
             return "No card"
+        
+        # Cards are shared and never change, so each one is rendered once
+        key = (card, show_strength)
+        cached = self._card_formats.get(key)
+        if cached is not None:
+            return cached
             
         # Get proper emoji for display
         display = card.get_display()
         
         # Add strength description
         if show_strength:
-            strength = CardUtils.get_card_strength_description(card)
+            strength = card.strength_desc
             display = f"{display} ({strength})"
             
         # Color based on card value
@@ -468,7 +620,8 @@ class DisplayManager:
                 display = TerminalColors.colorize(display, TerminalColors.BRIGHT_WHITE)
             else:  # Weak cards
                 display = TerminalColors.colorize(display, TerminalColors.BRIGHT_BLACK)
-                
+        
+        self._card_formats[key] = display
         return display
     
     def display_card_played(self, player, card, is_winning=False):
@@ -482,15 +635,17 @@ class DisplayManager:
             if ENABLE_COLORS:
                 play_str = TerminalColors.colorize(play_str, TerminalColors.BRIGHT_GREEN)
                 
-        print(play_str)
+        self.emit(play_str)
         
     def display_hand(self, player, highlight_index=None):
         """Display a player's hand with optional highlighting"""
+        if self.quiet:
+            return
         if not player.hand:
-            print(f"{player.name} has no cards")
+            self.emit(f"{player.name} has no cards")
             return
             
-        print(f"\n🃏 {player.name}'s Hand:")
+        lines = [f"\n🃏 {player.name}'s Hand:"]
         
         for i, card in enumerate(player.hand):
             card_display = self.format_card(card)
@@ -502,7 +657,9 @@ class DisplayManager:
                     display = TerminalColors.colorize(display, TerminalColors.BRIGHT_GREEN, bold=True)
                 display = f"> {display[2:]}"  # Replace initial spaces with arrow
                 
-            print(display)
+            lines.append(display)
+        
+        self.emit(*lines)
             
     def display_score(self, teams):
         """Display the current score"""
@@ -512,18 +669,19 @@ class DisplayManager:
             team_str = f"{team.name}: {team.score}"
             if ENABLE_COLORS:
                 team_str = TerminalColors.colorize(team_str, TerminalColors.BRIGHT_WHITE, bold=True)
-            print(team_str)
+            self.emit(team_str)
             
     def display_round_status(self, round_num, round_winners, teams):
         """Display the status of rounds won"""
         self.section(f"ROUND {round_num} STATUS", end_separator=False)
         
         if not round_winners:
-            print("No rounds played yet")
+            self.emit("No rounds played yet")
             return
             
-        team1_wins = sum(1 for winner in round_winners if winner in teams[0].players)
-        team2_wins = sum(1 for winner in round_winners if winner in teams[1].players)
+        team_wins = Counter(winner.team for winner in round_winners)
+        team1_wins = team_wins[teams[0]]
+        team2_wins = team_wins[teams[1]]
         
         team1_str = f"{teams[0].name}: {team1_wins}"
         team2_str = f"{teams[1].name}: {team2_wins}"
@@ -532,30 +690,26 @@ class DisplayManager:
             team1_str = TerminalColors.colorize(team1_str, TerminalColors.BRIGHT_GREEN if team1_wins > team2_wins else TerminalColors.BRIGHT_WHITE)
             team2_str = TerminalColors.colorize(team2_str, TerminalColors.BRIGHT_GREEN if team2_wins > team1_wins else TerminalColors.BRIGHT_WHITE)
             
-        print(f"Rounds won: {team1_str} | {team2_str}")
+        self.emit(f"Rounds won: {team1_str} | {team2_str}")
         
     def display_bet_status(self, current_bet, bet_value):
         """Display the current bet status"""
-        bet_status = f"Current Bet: {current_bet} ({bet_value} points)"
+        bet_status = f"Current Bet: {_BET_NAMES[current_bet]} ({bet_value} points)"
         
-        if ENABLE_COLORS:
-            if current_bet == "Vale Cuatro":
-                bet_status = TerminalColors.colorize(bet_status, TerminalColors.BRIGHT_RED, bold=True)
-            elif current_bet == "Retruco":
-                bet_status = TerminalColors.colorize(bet_status, TerminalColors.BRIGHT_YELLOW, bold=True)
-            elif current_bet == "Truco":
-                bet_status = TerminalColors.colorize(bet_status, TerminalColors.BRIGHT_GREEN, bold=True)
-                
-        print(bet_status)
+        color = _BET_STATUS_COLORS[current_bet]
+        if ENABLE_COLORS and color:
+            bet_status = TerminalColors.colorize(bet_status, color, bold=True)
+            
+        self.emit(bet_status)
         
     def display_card_ranking_summary(self):
         """Display a compact card ranking summary"""
-        print(Deck.get_card_cheat_sheet())
+        self.emit(Deck.get_card_cheat_sheet())
         
     def display_played_cards(self, round_cards):
         """Display cards played in the current round"""
         if not round_cards:
-            print("No cards played yet")
+            self.emit("No cards played yet")
             return
             
         self.section("CARDS PLAYED THIS ROUND", end_separator=False)
@@ -576,13 +730,15 @@ class DisplayManager:
 
     def display_game_status(self, game):
         """Display a comprehensive game status panel"""
+        if self.quiet:
+            return  # Skip building the whole panel only to drop it
         self.clear_screen()
         
         # Display top bar with key info
-        top_bar = f"Hand #{game.hand_number} | Round {game.current_round}/{ROUNDS_PER_HAND} | Bet: {game.current_bet} ({game.bet_value} pts)"
+        top_bar = f"Hand #{game.hand_number} | Round {game.current_round}/{ROUNDS_PER_HAND} | Bet: {_BET_NAMES[game.current_bet]} ({game.bet_value} pts)"
         if ENABLE_COLORS:
             top_bar = TerminalColors.colorize(top_bar, TerminalColors.BRIGHT_WHITE, TerminalColors.BG_BLUE, bold=True)
-        print("\n" + top_bar.center(self.screen_width))
+        self.emit("\n" + top_bar.center(self.screen_width))
         
         # Display score
         self.display_score(game.teams)
@@ -597,9 +753,9 @@ class DisplayManager:
             self.display_played_cards(game.round_cards)
             
         # Always display the human player's hand if it has cards
-        human_player = next((p for p in game.players if p.is_human), None)
+        human_player = game.human_player
         if human_player and human_player.hand:
-            print("\n🃏 Your Hand:")
+            self.emit("\n🃏 Your Hand:")
             self.display_hand(human_player)
                 
         # Show whose turn it is
@@ -608,64 +764,49 @@ class DisplayManager:
             turn_text = f"👉 {current_player.name}'s turn"
             if ENABLE_COLORS:
                 turn_text = TerminalColors.colorize(turn_text, TerminalColors.BRIGHT_GREEN, bold=True)
-            print("\n" + turn_text)
+            self.emit("\n" + turn_text)
             
         # Display history
         if self.history:
             self.section("RECENT GAME EVENTS", end_separator=False)
-            for event in self.history[-5:]:  # Show last 5 events
-                print(f"• {event}")
+            self.emit(*[f"• {event}" for event in self.history[-5:]])  # Show last 5 events
                 
-        print("\n" + self.create_separator())  # Bottom separator
+        self.emit("\n" + self.create_separator())  # Bottom separator
 
     def show_big_message(self, message, emoji="🎮"):
         """Display a message with decorative borders"""
-        print(f"\n{self.create_separator(title=f'{emoji} {message} {emoji}', color=TerminalColors.BRIGHT_MAGENTA)}")
+        self.emit(f"\n{self.create_separator(title=f'{emoji} {message} {emoji}', color=TerminalColors.BRIGHT_MAGENTA)}")
     
     def show_celebration(self, team_name, points, is_hand_win=False):
         """Show a celebration message when a team wins"""
-        if is_hand_win:
-            celebrations = [
-                f"🎉 {team_name} wins the hand and scores {points} point(s)! 🎉",
-                f"🏆 Impressive victory for {team_name}! +{points} point(s) 🏆",
-                f"💯 {team_name} takes the hand! {points} point(s) awarded! 💯",
-                f"🌟 Well played by {team_name}! They get {points} point(s)! 🌟"
-            ]
-        else:  # Round win
-            celebrations = [
-                f"✨ {team_name} takes the round! ✨",
-                f"👏 Nice play by {team_name}! 👏",
-                f"🔥 {team_name} is on fire! 🔥",
-                f"💪 Strong move by {team_name}! 💪"
-            ]
-        
-        message = random.choice(celebrations)
+        celebrations = _HAND_WIN_CELEBRATIONS if is_hand_win else _ROUND_WIN_CELEBRATIONS
+        message = self.rng.choice(celebrations).format(team_name=team_name, points=points)
         if ENABLE_COLORS:
             message = TerminalColors.colorize(message, TerminalColors.BRIGHT_YELLOW, bold=True)
             
-        print(f"\n{message}")
+        self.emit(f"\n{message}")
         self.add_to_history(message)
     
     def show_tie_message(self):
         """Show a message when there's a tie"""
-        tie_messages = [
-            "🔄 It's a tie! The cards are perfectly matched! 🔄",
-            "⚖️ Balance of power - this round is tied! ⚖️",
-            "🤝 Both sides equally matched - it's a tie! 🤝",
-            "📏 Too close to call - this round ends in a tie! 📏"
-        ]
-        
-        message = random.choice(tie_messages)
+        message = self.rng.choice(_TIE_MESSAGES)
         if ENABLE_COLORS:
             message = TerminalColors.colorize(message, TerminalColors.BRIGHT_CYAN)
             
-        print(f"\n{message}")
+        self.emit(f"\n{message}")
         self.add_to_history(message)
         
     def press_any_key(self, message="Press Enter to continue..."):
         """Wait for user to press Enter"""
-        input(f"\n⏸️ {message}")
+        if not self.interactive:
+            return True
+        InputUtils.read_line(f"\n⏸️ {message}")
         return True
+    
+    def pause(self, seconds=SCROLL_DELAY):
+        """Give the player a moment to read, unless nobody is watching"""
+        if self.interactive and not self.quiet:
+            time.sleep(seconds)
 
 
 # ============== CARD ADVISOR ===============
@@ -742,17 +883,17 @@ class CardAdvisor:
             
             # Check if we have any top cards
             if sorted_hand[0].value >= 11:  # One of the top 4 cards
-                advice.append(f"• You have {sorted_hand[0].get_display()} ({CardUtils.get_card_strength_description(sorted_hand[0])})")
+                advice.append(f"• You have {sorted_hand[0].get_display()} ({sorted_hand[0].strength_desc})")
                 advice.append("• Playing your strongest card first can intimidate opponents.")
                 advice.append(f"• Recommended: Card #{hand.index(sorted_hand[0])+1}")
             elif sorted_hand[0].value >= 8:  # Good cards (3s, 2s, 1s)
-                advice.append(f"• Your strongest card is {sorted_hand[0].get_display()} ({CardUtils.get_card_strength_description(sorted_hand[0])})")
+                advice.append(f"• Your strongest card is {sorted_hand[0].get_display()} ({sorted_hand[0].strength_desc})")
                 advice.append("• Playing a strong card first can help win the round.")
                 advice.append(f"• Recommended: Card #{hand.index(sorted_hand[0])+1}")
             else:
                 # We don't have any strong cards
                 advice.append("• You don't have any particularly strong cards.")
-                advice.append(f"• Your strongest is {sorted_hand[0].get_display()} ({CardUtils.get_card_strength_description(sorted_hand[0])})")
+                advice.append(f"• Your strongest is {sorted_hand[0].get_display()} ({sorted_hand[0].strength_desc})")
                 advice.append("• Consider playing your weakest card to save stronger ones.")
                 advice.append(f"• Recommended: Card #{hand.index(sorted_hand[-1])+1}")
                 
@@ -763,21 +904,30 @@ class CardAdvisor:
             advice = []
             
             # Find the highest card played so far
-            highest_card = max((card for _, card in round_cards), key=lambda x: x.value)
-            advice.append(f"• Highest card played: {highest_card.get_display()} ({CardUtils.get_card_strength_description(highest_card)})")
-            
-            # Check if we have any cards that can beat it
-            better_cards = [card for card in hand if card.value > highest_card.value]
-            if better_cards:
-                # Find the lowest card that can still win
-                min_winner = min(better_cards, key=lambda x: x.value)
-                advice.append(f"• You can win with {min_winner.get_display()} ({CardUtils.get_card_strength_description(min_winner)})")
-                advice.append(f"• Recommended: Card #{hand.index(min_winner)+1}")
+            highest_card = round_cards[0][1]
+            for _, card in round_cards:
+                if card.value > highest_card.value:
+                    highest_card = card
+            advice.append(f"• Highest card played: {highest_card.get_display()} ({highest_card.strength_desc})")
+            
+            # One scan finds both the lowest card that can still win and the weakest card
+            winner_index = None
+            weakest_index = 0
+            for i, card in enumerate(hand):
+                if card.value > highest_card.value and (winner_index is None or card.value < hand[winner_index].value):
+                    winner_index = i
+                if card.value < hand[weakest_index].value:
+                    weakest_index = i
+            
+            if winner_index is not None:
+                min_winner = hand[winner_index]
+                advice.append(f"• You can win with {min_winner.get_display()} ({min_winner.strength_desc})")
+                advice.append(f"• Recommended: Card #{winner_index+1}")
             else:
                 # We can't win this round
                 advice.append("• You can't beat the highest card played.")
                 advice.append("• Consider playing your weakest card to minimize losses.")
-                advice.append(f"• Recommended: Card #{hand.index(min(hand, key=lambda x: x.value))+1}")
+                advice.append(f"• Recommended: Card #{weakest_index+1}")
                 
             return "\n".join(advice)
     
@@ -800,7 +950,7 @@ class CardAdvisor:
         
         advice = []
         advice.append(f"• Hand strength: {strength_percentage:.1f}%")
-        advice.append(f"• Your strongest card: {strongest_card.get_display()} ({CardUtils.get_card_strength_description(strongest_card)})")
+        advice.append(f"• Your strongest card: {strongest_card.get_display()} ({strongest_card.strength_desc})")
         
         if current_bet == "No bet":
             # Should we initiate a bet?
@@ -861,26 +1011,18 @@ class CardAdvisor:
         for suit, cards in cards_by_suit.items():
             if len(cards) >= 2:
                 # Calculate points for this suit
-                cards.sort(key=lambda c: c.get_envido_value(), reverse=True)
-                points = 20 + cards[0].get_envido_value() + cards[1].get_envido_value()
+                cards.sort(key=lambda c: c.envido_value, reverse=True)
+                points = 20 + cards[0].envido_value + cards[1].envido_value
                 
                 # Display the cards that make up this combination
-                card_str = " + ".join([f"{c.get_display()} ({c.get_envido_value()})" for c in cards[:2]])
+                card_str = " + ".join([f"{c.display} ({c.envido_value})" for c in cards[:2]])
                 
                 advice.append(f"• {suit}: {points} points (20 + {card_str})")
             elif len(cards) == 1:
-                points = cards[0].get_envido_value()
+                points = cards[0].envido_value
                 advice.append(f"• {suit}: {points} points ({cards[0].get_display()})")
         
-        # Determine best suit and points
-        best_suit = max(cards_by_suit.items(), key=lambda x: len(x[1]))[0]
-        cards_in_best_suit = cards_by_suit[best_suit]
-        
-        if len(cards_in_best_suit) >= 2:
-            cards_in_best_suit.sort(key=lambda c: c.get_envido_value(), reverse=True)
-            best_points = 20 + cards_in_best_suit[0].get_envido_value() + cards_in_best_suit[1].get_envido_value()
-        else:
-            best_points = max(card.get_envido_value() for card in hand)
+        best_points = _envido_points(hand)
         
         advice.append(f"\n💯 Your best Envido is {best_points} points")
         
@@ -901,6 +1043,90 @@ class CardAdvisor:
 
 # ============== TUTORIAL MANAGER ===============
 
+# Tutorial screens are static, so each is joined once at import and written in one go
+_CARD_RANKING_TUTORIAL = "\n".join([
+    Deck.get_card_rank_explanation(),
+    "\n🔑 Remember: This ranking is unique to Truco and mastering it is key to success!",
+    "\n💡 During the game, we'll show each card's relative strength to help you learn.",
+    "\n💬 You can use the Card Advisor (type 'help' during your turn) for guidance.",
+])
+
+_BETTING_TUTORIAL = "\n".join([
+    "Truco has a unique betting system:",
+    "",
+    "1. 🎲 Truco - Worth 2 points",
+    "   - Can be raised to Retruco",
+    "",
+    "2. 🎯 Retruco - Worth 3 points",
+    "   - Can be raised to Vale Cuatro",
+    "",
+    "3. 🔥 Vale Cuatro - Worth 4 points",
+    "   - The highest possible bet",
+    "",
+    "When a bet is made, you can:",
+    "✅ Accept: Play for the current bet value",
+    "⬆️ Raise: Increase to the next level",
+    "❌ Decline: Give up the hand and opponent gets the current points at stake",
+    "",
+    "🃏 Betting adds strategy and bluffing to the game!",
+])
+
+_ENVIDO_TUTORIAL = "\n".join([
+    "Envido is a separate betting feature in Truco:",
+    "",
+    "🔸 Envido is played at the beginning of each hand, before playing cards",
+    "🔸 Players bet on having the highest point total from cards of the same suit",
+    "🔸 Only cards 1-7 count for Envido points:",
+    "  - Cards 1-7 are worth their face value",
+    "  - Face cards (Sota, Caballo, Rey) are worth 0 points",
+    "🔸 Envido point calculation:",
+    "  - 20 points base for having two or more cards of the same suit",
+    "  - Add the values of your two highest cards of that suit",
+    "  - Example: Having 7🗡️ and 4🗡️ = 20 + 7 + 4 = 31 points",
+    "",
+    "🔸 Common Envido bets:",
+    "  - Envido: Worth 2 points",
+    "  - Real Envido: Worth 3 points",
+    "  - Falta Envido: Worth enough points to win the game",
+    "",
+    "🎮 In this game you'll be able to use Envido betting!",
+])
+
+_BLUFFING_TUTORIAL = "\n".join([
+    "Truco is as much about psychology as it is about cards:",
+    "",
+    "🗣️ Verbal taunts and bluffs are a huge part of the game",
+    "🃏 Players often bet aggressively with weak hands to trick opponents",
+    "🎭 Reactions when playing cards can mislead others about your hand",
+    "😏 Experienced players develop their own betting and bluffing style",
+    "🤔 Watch for patterns in how opponents bet to guess their strategy",
+    "",
+    "💡 In this version, AI players will have unique personalities and verbal styles",
+    "   Pay attention to their comments - they might reveal their strategy... or not!",
+])
+
+_IN_GAME_HELP = "\n".join([
+    "🃏 Card Ranking (strongest to weakest):",
+    "1. 1 of Espadas (🗡️) - ⭐⭐⭐",
+    "2. 1 of Bastos (🏑) - ⭐⭐",
+    "3. 7 of Espadas (🗡️) - ⭐",
+    "4. 7 of Oros (🪙) - ✨",
+    "5. 3s - 💪",
+    "6. 2s - 👍",
+    "7. Other 1s - 👌",
+    "8. Face cards - ➖",
+    "9. Other 7s - 🔽",
+    "10. 6s, 5s, 4s - 👎",
+    "",
+    "💬 Commands:",
+    "- Type 'help' during your turn for this help menu",
+    "- Type 'advisor' to get advice on which card to play",
+    "- Type 'ranking' to see the full card ranking chart",
+    "- Type 'values' to see your hand with detailed card descriptions",
+    "- Type a number (1-3) to play that card from your hand",
+])
+
+
 class TutorialManager:
     def __init__(self, display_manager):
         self.display_manager = display_manager
@@ -908,117 +1134,31 @@ class TutorialManager:
     def show_card_ranking_tutorial(self):
         """Display the card ranking in Truco to help the player learn"""
         self.display_manager.show_big_message("CARD RANKING IN ARGENTINIAN TRUCO", "🃏")
-        
-        # Get the full explanation
-        print(Deck.get_card_rank_explanation())
-        
-        print("\n🔑 Remember: This ranking is unique to Truco and mastering it is key to success!")
-        print("\n💡 During the game, we'll show each card's relative strength to help you learn.")
-        print("\n💬 You can use the Card Advisor (type 'help' during your turn) for guidance.")
-        
+        self.display_manager.emit(_CARD_RANKING_TUTORIAL)
         self.display_manager.press_any_key()
     
     def show_betting_tutorial(self):
         """Display information about betting in Truco"""
         self.display_manager.show_big_message("BETTING IN ARGENTINIAN TRUCO", "💰")
-        
-        bet_info = [
-            "Truco has a unique betting system:",
-            "",
-            "1. 🎲 Truco - Worth 2 points",
-            "   - Can be raised to Retruco",
-            "",
-            "2. 🎯 Retruco - Worth 3 points",
-            "   - Can be raised to Vale Cuatro",
-            "",
-            "3. 🔥 Vale Cuatro - Worth 4 points",
-            "   - The highest possible bet",
-            "",
-            "When a bet is made, you can:",
-            "✅ Accept: Play for the current bet value",
-            "⬆️ Raise: Increase to the next level",
-            "❌ Decline: Give up the hand and opponent gets the current points at stake",
-            "",
-            "🃏 Betting adds strategy and bluffing to the game!"
-        ]
-        
-        print("\n" + "\n".join(bet_info))
+        self.display_manager.emit("\n" + _BETTING_TUTORIAL)
         self.display_manager.press_any_key()
     
     def show_envido_tutorial(self):
         """Display information about Envido in Truco"""
         self.display_manager.show_big_message("ENVIDO IN ARGENTINIAN TRUCO", "💡")
-        
-        envido_info = [
-            "Envido is a separate betting feature in Truco:",
-            "",
-            "🔸 Envido is played at the beginning of each hand, before playing cards",
-            "🔸 Players bet on having the highest point total from cards of the same suit",
-            "🔸 Only cards 1-7 count for Envido points:",
-            "  - Cards 1-7 are worth their face value",
-            "  - Face cards (Sota, Caballo, Rey) are worth 0 points",
-            "🔸 Envido point calculation:",
-            "  - 20 points base for having two or more cards of the same suit",
-            "  - Add the values of your two highest cards of that suit",
-            "  - Example: Having 7🗡️ and 4🗡️ = 20 + 7 + 4 = 31 points",
-            "",
-            "🔸 Common Envido bets:",
-            "  - Envido: Worth 2 points",
-            "  - Real Envido: Worth 3 points",
-            "  - Falta Envido: Worth enough points to win the game",
-            "",
-            "🎮 In this game you'll be able to use Envido betting!"
-        ]
-        
-        print("\n" + "\n".join(envido_info))
+        self.display_manager.emit("\n" + _ENVIDO_TUTORIAL)
         self.display_manager.press_any_key()
         
     def show_verbal_aspect_tutorial(self):
         """Explain the verbal/psychological aspects of Truco"""
         self.display_manager.show_big_message("THE ART OF BLUFFING IN TRUCO", "🎭")
-        
-        bluffing_info = [
-            "Truco is as much about psychology as it is about cards:",
-            "",
-            "🗣️ Verbal taunts and bluffs are a huge part of the game",
-            "🃏 Players often bet aggressively with weak hands to trick opponents",
-            "🎭 Reactions when playing cards can mislead others about your hand",
-            "😏 Experienced players develop their own betting and bluffing style",
-            "🤔 Watch for patterns in how opponents bet to guess their strategy",
-            "",
-            "💡 In this version, AI players will have unique personalities and verbal styles",
-            "   Pay attention to their comments - they might reveal their strategy... or not!"
-        ]
-        
-        print("\n" + "\n".join(bluffing_info))
+        self.display_manager.emit("\n" + _BLUFFING_TUTORIAL)
         self.display_manager.press_any_key()
         
     def show_help_during_game(self):
         """Display a brief help message during the game"""
         self.display_manager.section("TRUCO HELP", color=TerminalColors.BRIGHT_GREEN)
-        
-        help_text = [
-            "🃏 Card Ranking (strongest to weakest):",
-            "1. 1 of Espadas (🗡️) - ⭐⭐⭐",
-            "2. 1 of Bastos (🏑) - ⭐⭐",
-            "3. 7 of Espadas (🗡️) - ⭐",
-            "4. 7 of Oros (🪙) - ✨",
-            "5. 3s - 💪",
-            "6. 2s - 👍",
-            "7. Other 1s - 👌",
-            "8. Face cards - ➖",
-            "9. Other 7s - 🔽",
-            "10. 6s, 5s, 4s - 👎",
-            "",
-            "💬 Commands:",
-            "- Type 'help' during your turn for this help menu",
-            "- Type 'advisor' to get advice on which card to play",
-            "- Type 'ranking' to see the full card ranking chart",
-            "- Type 'values' to see your hand with detailed card descriptions",
-            "- Type a number (1-3) to play that card from your hand"
-        ]
-        
-        print("\n" + "\n".join(help_text))
+        self.display_manager.emit("\n" + _IN_GAME_HELP)
         self.display_manager.press_any_key()
 
 
@@ -1028,7 +1168,7 @@ class CommentGenerator:
     """Generates verbal comments for AI players based on game state and personality"""
     
     # Different types of comments by category
-    TRUCO_CALL = [
+    TRUCO_CALL = (
         "¡Truco!",
         "TRUCO! What do you say?",
         "Let's make it interesting... Truco!",
@@ -1036,38 +1176,38 @@ class CommentGenerator:
         "Time to raise the stakes! Truco!",
         "You don't look so confident. Truco!",
         "Truco! Can you handle it?",
-    ]
+    )
     
-    TRUCO_CALL_CAUTIOUS = [
+    TRUCO_CALL_CAUTIOUS = (
         "Truco?", 
         "I think... Truco?", 
         "Maybe Truco?"
-    ]
+    )
     
-    TRUCO_CALL_BLUFFER = [
+    TRUCO_CALL_BLUFFER = (
         "TRUCO! (But am I bluffing?)", 
         "Truco! Don't look at my face!"
-    ]
+    )
     
-    RETRUCO_CALL = [
+    RETRUCO_CALL = (
         "¡Retruco!",
         "RETRUCO! Let's see what you've got!",
         "Not enough? Then RETRUCO!",
         "I'm doubling down! Retruco!",
         "Retruco! Getting nervous yet?",
         "Let's turn up the heat! Retruco!",
-    ]
+    )
     
-    VALE_CUATRO_CALL = [
+    VALE_CUATRO_CALL = (
         "¡Vale cuatro!",
         "VALE CUATRO! All in!",
         "Vale Cuatro! No turning back now!",
         "Going all the way! Vale Cuatro!",
         "I'm not bluffing now! VALE CUATRO!",
         "Vale Cuatro! This hand is mine!",
-    ]
+    )
     
-    ACCEPT_BET = [
+    ACCEPT_BET = (
         "Quiero!",
         "I'm in!",
         "Challenge accepted!",
@@ -1075,24 +1215,24 @@ class CommentGenerator:
         "I'll take that bet!",
         "Game on!",
         "You're on!",
-    ]
+    )
     
-    ACCEPT_BET_AGGRESSIVE = [
+    ACCEPT_BET_AGGRESSIVE = (
         "Quiero! Bring it on!", 
         "Quiero! You're going down!"
-    ]
+    )
     
-    ACCEPT_BET_CAUTIOUS = [
+    ACCEPT_BET_CAUTIOUS = (
         "Hmm... Quiero, I guess.", 
         "I'll accept, cautiously."
-    ]
+    )
     
-    ACCEPT_BET_BLUFFER = [
+    ACCEPT_BET_BLUFFER = (
         "Quiero! (Was that too eager?)", 
         "Sure, I'll play along."
-    ]
+    )
     
-    DECLINE_BET = [
+    DECLINE_BET = (
         "No quiero.",
         "I'll pass this time.",
         "Not worth it.",
@@ -1100,130 +1240,174 @@ class CommentGenerator:
         "Take the points, I'm saving for later.",
         "You win this one.",
         "I don't like my chances.",
-    ]
+    )
     
-    DECLINE_BET_CAUTIOUS = [
+    DECLINE_BET_CAUTIOUS = (
         "No quiero. Too risky.", 
         "I'll pass on that."
-    ]
+    )
     
-    PLAY_STRONG_CARD = [
+    PLAY_STRONG_CARD = (
         "Take that!",
         "Beat this if you can!",
         "How's this for a card?",
         "Watch and learn!",
         "Got something better?",
         "Top that!",
-    ]
+    )
     
-    PLAY_STRONG_CARD_AGGRESSIVE = [
+    PLAY_STRONG_CARD_AGGRESSIVE = (
         "Take THAT!", 
         "BOOM! Try to beat that!"
-    ]
+    )
     
-    PLAY_WEAK_CARD = [
+    PLAY_WEAK_CARD = (
         "Let's see what happens...",
         "Just warming up.",
         "Hmm, not my best...",
         "Saving the good ones for later.",
         "Sometimes you have to lose a battle to win the war.",
         "This isn't my strongest suit.",
-    ]
+    )
     
-    PLAY_WEAK_CARD_BLUFFER = [
+    PLAY_WEAK_CARD_BLUFFER = (
         "This should do it!", 
         "Let's see you beat this!"
-    ]
+    )
     
-    BLUFF_COMMENTS = [
+    BLUFF_COMMENTS = (
         "I've got this hand locked down!",
         "You should probably fold now...",
         "The best cards always seem to find me!",
         "This might be my best hand ever!",
         "Sometimes you just get lucky!",
         "I can see you're getting worried!",
-    ]
+    )
     
-    WIN_COMMENTS = [
+    WIN_COMMENTS = (
         "¡Así se juega!",
         "That's how it's done!",
         "Was there ever any doubt?",
         "Just as I planned!",
         "Did you see that coming?",
         "That's what I'm talking about!",
-    ]
+    )
     
-    LOSE_COMMENTS = [
+    LOSE_COMMENTS = (
         "Nicely played!",
         "Hmm, not what I expected.",
         "You got lucky there.",
         "Don't get used to winning.",
         "Enjoy it while it lasts!",
         "I'll remember that move.",
-    ]
+    )
     
-    LOSE_COMMENTS_AGGRESSIVE = [
+    LOSE_COMMENTS_AGGRESSIVE = (
         "Just luck!", 
         "Don't get cocky!", 
         "This isn't over!"
-    ]
+    )
+    
+    # Spoken by an AI opponent at the start of a hand, depending on the score
+    HAND_START_TRAILING = (
+        "Time to catch up!",
+        "You won't be ahead for long!",
+        "Let's see if your luck continues...",
+        "Don't get too confident!",
+    )
+    
+    HAND_START_LEADING = (
+        "I'm feeling good about this hand!",
+        "We're on a roll now!",
+        "Try to keep up, will you?",
+        "This game is ours!",
+    )
+    
+    HAND_START_TIED = (
+        "Time to break this tie!",
+        "Let's see who takes the lead!",
+        "May the best team win!",
+        "This hand will be decisive!",
+    )
+    
+    # Spoken by an AI player whose team won the game
+    GAME_WIN_AI = (
+        "Better luck next time!",
+        "That was a good game! Thanks for playing!",
+        "We make a great team!",
+        "That's how it's done in Argentina!",
+        "Victory is sweet!",
+    )
+    
+    # Spoken on the human player's behalf
+    HAND_WIN_HUMAN = (
+        "That's how it's done!",
+        "Great hand, team!",
+        "We played that perfectly!",
+        "That's what I'm talking about!",
+        "Let's keep this momentum going!",
+    )
+    
+    PLAY_STRONG_CARD_HUMAN = (
+        "Take that!",
+        "Beat this if you can!",
+        "How's this for a card?",
+        "Watch and learn!",
+        "This should do the trick!",
+    )
+    
+    PLAY_BLUFF_CARD_HUMAN = (
+        "I've got this round secured!",
+        "Let's see you top that!",
+        "I'm feeling good about this play!",
+        "The best card at the perfect time!",
+    )
+    
+    ROUND_WIN_HUMAN = (
+        "Got it!",
+        "That's how it's done!",
+        "Perfect timing!",
+        "Just as I planned!",
+    )
+    
+    ROUND_LOSS_HUMAN = (
+        "Nice play.",
+        "You got me there.",
+        "I'll get you in the next round.",
+        "Well played.",
+    )
+    
+    # Comment type -> personality -> bank; "default" covers every other personality
+    BANKS = {
+        "truco_call": {"cautious": TRUCO_CALL_CAUTIOUS, "bluffer": TRUCO_CALL_BLUFFER, "default": TRUCO_CALL},
+        "retruco_call": {"default": RETRUCO_CALL},
+        "vale_cuatro_call": {"default": VALE_CUATRO_CALL},
+        "accept_bet": {
+            "aggressive": ACCEPT_BET_AGGRESSIVE,
+            "cautious": ACCEPT_BET_CAUTIOUS,
+            "bluffer": ACCEPT_BET_BLUFFER,
+            "default": ACCEPT_BET,
+        },
+        "decline_bet": {"cautious": DECLINE_BET_CAUTIOUS, "default": DECLINE_BET},
+        "play_strong_card": {"aggressive": PLAY_STRONG_CARD_AGGRESSIVE, "default": PLAY_STRONG_CARD},
+        "play_weak_card": {"bluffer": PLAY_WEAK_CARD_BLUFFER, "default": PLAY_WEAK_CARD},
+        "bluff": {"default": BLUFF_COMMENTS},
+        "win": {"default": WIN_COMMENTS},
+        "lose": {"aggressive": LOSE_COMMENTS_AGGRESSIVE, "default": LOSE_COMMENTS},
+    }
     
     @staticmethod
-    def get_comment(comment_type, personality="normal"):
+    def get_comment(comment_type, personality="normal", rng=random):
         """Get a comment of a specific type based on personality"""
         # Select the appropriate comment pool
-        if comment_type == "truco_call":
-            if personality == "aggressive":
-                pool = CommentGenerator.TRUCO_CALL
-            elif personality == "cautious":
-                pool = CommentGenerator.TRUCO_CALL_CAUTIOUS
-            elif personality == "bluffer":
-                pool = CommentGenerator.TRUCO_CALL_BLUFFER
-            else:
-                pool = CommentGenerator.TRUCO_CALL
-        elif comment_type == "retruco_call":
-            pool = CommentGenerator.RETRUCO_CALL
-        elif comment_type == "vale_cuatro_call":
-            pool = CommentGenerator.VALE_CUATRO_CALL
-        elif comment_type == "accept_bet":
-            if personality == "aggressive":
-                pool = CommentGenerator.ACCEPT_BET_AGGRESSIVE
-            elif personality == "cautious":
-                pool = CommentGenerator.ACCEPT_BET_CAUTIOUS
-            elif personality == "bluffer":
-                pool = CommentGenerator.ACCEPT_BET_BLUFFER
-            else:
-                pool = CommentGenerator.ACCEPT_BET
-        elif comment_type == "decline_bet":
-            if personality == "cautious":
-                pool = CommentGenerator.DECLINE_BET_CAUTIOUS
-            else:
-                pool = CommentGenerator.DECLINE_BET
-        elif comment_type == "play_strong_card":
-            if personality == "aggressive":
-                pool = CommentGenerator.PLAY_STRONG_CARD_AGGRESSIVE
-            else:
-                pool = CommentGenerator.PLAY_STRONG_CARD
-        elif comment_type == "play_weak_card":
-            if personality == "bluffer":
-                pool = CommentGenerator.PLAY_WEAK_CARD_BLUFFER
-            else:
-                pool = CommentGenerator.PLAY_WEAK_CARD
-        elif comment_type == "bluff":
-            pool = CommentGenerator.BLUFF_COMMENTS
-        elif comment_type == "win":
-            pool = CommentGenerator.WIN_COMMENTS
-        elif comment_type == "lose":
-            if personality == "aggressive":
-                pool = CommentGenerator.LOSE_COMMENTS_AGGRESSIVE
-            else:
-                pool = CommentGenerator.LOSE_COMMENTS
-        else:
+        banks = CommentGenerator.BANKS.get(comment_type)
+        if banks is None:
             # Default to a generic comment
             return "..."
+        pool = banks.get(personality) or banks["default"]
             
         # Return a random comment from the selected pool
-        comment = random.choice(pool)
+        comment = rng.choice(pool)
         
         # Format with color if enabled
         if ENABLE_COLORS:
@@ -1236,10 +1420,181 @@ class CommentGenerator:
 
 # ============== BETTING SYSTEMS ===============
 
+# Default generator for the AI helpers; games pass their own TrucoGame.rng
+_RNG = random.Random()
+
+
+def _threshold(probability):
+    """Convert a probability into a threshold for _coin"""
+    return round(probability * 65536)
+
+
+def _coin(threshold, rng=_RNG):
+    """Return True with probability threshold/65536 using a single 16-bit draw"""
+    return rng.getrandbits(16) < threshold
+
+
+_P30 = _threshold(0.3)
+_P40 = _threshold(0.4)
+_P70 = _threshold(0.7)
+
+
+class BetState(IntEnum):
+    """Truco bet levels, in raising order (a raise moves to the next level)"""
+    NONE = 0
+    TRUCO = 1
+    RETRUCO = 2
+    VALE_CUATRO = 3
+
+
+# Indexed by BetState
+_BET_POINTS = (1, 2, 3, 4)
+_BET_NAMES = ("No bet", "Truco", "Retruco", "Vale Cuatro")
+_BET_CALL_COMMENTS = (None, "truco_call", "retruco_call", "vale_cuatro_call")
+_BET_STATUS_COLORS = (None, TerminalColors.BRIGHT_GREEN, TerminalColors.BRIGHT_YELLOW, TerminalColors.BRIGHT_RED)
+
+# Scale on an AI's bluff-raise chance when answering each Truco bet level.
+# Nothing outranks Vale Cuatro, so it can only be accepted or declined.
+_TRUCO_RAISE_SCALES = (0.0, 1.0, 0.5, 0.0)
+
+# _coin threshold for an AI to call or raise Truco without the cards to back it
+_BLUFF_THRESHOLDS = {
+    "bluffer": _threshold(0.4),     # Bluffers bluff more
+    "cautious": _threshold(0.1),    # Cautious players bluff less
+    "aggressive": _threshold(0.3),  # Aggressive players bluff more
+    "default": _threshold(0.2),
+}
+
+# Personality -> _coin threshold, per bet level, to bluff a raise instead of declining a Truco bet
+_TRUCO_RAISE_BLUFFS = {
+    personality: tuple(_threshold(chance * scale) for scale in _TRUCO_RAISE_SCALES)
+    for personality, chance in (("aggressive", 0.25), ("cautious", 0.05), ("bluffer", 0.15), ("default", 0.1))
+}
+
+# Menu line for raising from each level (nothing to raise to from Vale Cuatro)
+_RAISE_OPTIONS = ("2. 🎲 Truco (2 points)", "2. 🎯 Retruco (3 points)", "2. 🔥 Vale Cuatro (4 points)", None)
+
+# Response menu shown to the human for each bet they face, and the action behind each number
+_RESPONSE_MENUS = (
+    None,
+    ("\n".join([
+        "1. ✅ Accept (play for 2 points)",
+        "2. ⬆️ Raise to Retruco (3 points)",
+        "3. ❌ Decline (opponent gets 1 point)",
+        "4. 💡 Get betting advice",
+    ]), ("accept", "raise", "decline", "advice")),
+    ("\n".join([
+        "1. ✅ Accept (play for 3 points)",
+        "2. ⬆️ Raise to Vale Cuatro (4 points)",
+        "3. ❌ Decline (opponent gets 2 points)",
+        "4. 💡 Get betting advice",
+    ]), ("accept", "raise", "decline", "advice")),
+    ("\n".join([
+        "1. ✅ Accept (play for 4 points)",
+        "2. ❌ Decline (opponent gets 3 points)",
+        "3. 💡 Get betting advice",
+    ]), ("accept", "decline", "advice")),
+)
+
+
+class EnvidoBet(IntEnum):
+    """Envido bet levels, in raising order"""
+    ENVIDO = 0
+    REAL_ENVIDO = 1
+    FALTA_ENVIDO = 2
+
+
+# Indexed by EnvidoBet; Falta Envido is worth whatever the winner needs to reach the target
+_ENVIDO_NAMES = ("Envido", "Real Envido", "Falta Envido")
+_ENVIDO_POINTS = (2, 3, None)
+
+# Points the AI team gets when the human declines each Envido bet
+_ENVIDO_DECLINE_POINTS = (1, 1, 3)
+
+# _coin threshold for an AI to call Envido without the points to back it
+_ENVIDO_BLUFF_THRESHOLDS = {
+    "bluffer": _threshold(0.5),
+    "cautious": _threshold(0.15),
+    "aggressive": _threshold(0.4),
+    "default": _P30,
+}
+
+# Scale on an AI's bluff-raise chance when answering each Envido bet; Falta Envido cannot be raised
+_ENVIDO_RAISE_SCALES = (1.0, 0.5, 0.0)
+
+# Personality -> _coin threshold, per Envido bet, to bluff a raise instead of declining it
+_ENVIDO_RAISE_BLUFFS = {
+    personality: tuple(_threshold(chance * scale) for scale in _ENVIDO_RAISE_SCALES)
+    for personality, chance in (("aggressive", 0.2), ("cautious", 0.05), ("bluffer", 0.15), ("default", 0.1))
+}
+
+# Response menu shown to the human for each Envido bet they face, and the action behind each number
+_ENVIDO_RESPONSE_MENUS = (
+    ("\n".join([
+        "1. ✅ Accept (play for 2 points)",
+        "2. ⬆️ Raise to Real Envido (3 more points)",
+        "3. 🚀 Raise to Falta Envido (enough to win)",
+        "4. ❌ Decline (opponent gets 1 point)",
+        "5. 💡 Get Envido advice",
+    ]), ("accept", "raise", "falta", "decline", "advice")),
+    ("\n".join([
+        "1. ✅ Accept (play for 3 more points)",
+        "2. 🚀 Raise to Falta Envido (enough to win)",
+        "3. ❌ Decline (opponent gets previous points)",
+        "4. 💡 Get Envido advice",
+    ]), ("accept", "raise", "decline", "advice")),
+    ("\n".join([
+        "1. ✅ Accept (play for enough points to win)",
+        "2. ❌ Decline (opponent gets previous points)",
+        "3. 💡 Get Envido advice",
+    ]), ("accept", "decline", "advice")),
+)
+
+
 class BettingSystem:
     """Base class for betting systems"""
     def __init__(self, display_manager):
         self.display_manager = display_manager
+    
+    def _read_menu_choice(self, game, player, prompt, refresh_status=False):
+        """Read one menu entry, answering the in-game help commands along the way.
+        
+        Returns the number entered, or None if the input was a command, empty or not a number.
+        """
+        choice = InputUtils.read_line(prompt)
+        command = choice.lower()
+        
+        # Check for help commands
+        if command in ('help', 'h', '?'):
+            game.tutorial_manager.show_help_during_game()
+            if refresh_status:
+                self.display_manager.display_game_status(game)
+            return None
+        elif command == 'advisor':
+            is_first_player = len(game.round_cards) == 0
+            advice = CardAdvisor.get_play_advice(player.hand, game.round_cards, is_first_player, self.display_manager)
+            self.display_manager.emit(advice)
+            return None
+        elif command == 'values':
+            # Display detailed card information
+            self.display_manager.section("DETAILED CARD VALUES", color=TerminalColors.BRIGHT_MAGENTA)
+            for card in player.hand:
+                self.display_manager.emit(f"\n{card.get_detailed_description()}")
+            return None
+        elif command == 'ranking':
+            self.display_manager.emit(Deck.get_card_rank_explanation())
+            return None
+        
+        # Skip empty input
+        if not choice:
+            return None
+        if choice.isdecimal():
+            return int(choice)  # Plain digits skip the exception path
+        try:
+            return int(choice)
+        except ValueError:
+            self.display_manager.emit("❌ Please enter a valid number or command.")
+            return None
 
 
 class TrucoBetting(BettingSystem):
@@ -1254,7 +1609,7 @@ class TrucoBetting(BettingSystem):
         self.display_manager.section("BETTING OPTIONS", color=TerminalColors.BRIGHT_YELLOW)
         
         # Show the human player's hand again before betting decisions
-        human_player = next((p for p in game.players if p.is_human), None)
+        human_player = game.human_player
         if human_player and human_player.hand:
             self.display_manager.display_hand(human_player)
         
@@ -1262,123 +1617,75 @@ class TrucoBetting(BettingSystem):
         if game.round_cards:
             self.display_manager.display_played_cards(game.round_cards)
         
-        print("1. ➡️ Continue without betting")
-        
-        # Determine available bets based on current bet
-        if game.current_bet == "No bet":
-            print("2. 🎲 Truco (2 points)")
-            bet_options = ["Continue", "Truco"]
-        elif game.current_bet == "Truco":
-            print("2. 🎯 Retruco (3 points)")
-            bet_options = ["Continue", "Retruco"]
-        elif game.current_bet == "Retruco":
-            print("2. 🔥 Vale Cuatro (4 points)")
-            bet_options = ["Continue", "Vale Cuatro"]
+        # Determine available bets based on current bet, then offer advice
+        raise_option = _RAISE_OPTIONS[game.current_bet]
+        if raise_option:
+            bet_options = ["Continue", BetState(game.current_bet + 1)]
+            self.display_manager.emit("1. ➡️ Continue without betting", raise_option, "3. 💡 Get betting advice")
         else:
             # No more raising possible
             bet_options = ["Continue"]
-            
-        # Offer advice option
-        print("3. 💡 Get betting advice")
+            self.display_manager.emit("1. ➡️ Continue without betting", "3. 💡 Get betting advice")
         
         valid_choice = False
         while not valid_choice:
-            try:
-                choice = input("\n💬 Do you want to bet? Enter your choice: ").strip()
+            choice = self._read_menu_choice(game, player, "\n💬 Do you want to bet? Enter your choice: ", refresh_status=True)
+            if choice is None:
+                continue
+            
+            if choice == 1:
+                # Continue without betting
+                self.display_manager.emit("➡️ Continuing without betting.")
+                valid_choice = True
+            elif choice == 2 and len(bet_options) > 1:
+                # Make a bet
+                new_bet = bet_options[1]
+                self.display_manager.emit(f"\n🎯 You called {_BET_NAMES[new_bet]}!")
                 
-                # Check for help commands
-                if choice.lower() in ['help', 'h', '?']:
-                    game.tutorial_manager.show_help_during_game()
-                    self.display_manager.display_game_status(game)
-                    continue
-                elif choice.lower() == 'advisor':
-                    is_first_player = len(game.round_cards) == 0
-                    advice = CardAdvisor.get_play_advice(player.hand, game.round_cards, is_first_player, self.display_manager)
-                    print(advice)
-                    continue
-                elif choice.lower() == 'values':
-                    # Display detailed card information
-                    self.display_manager.section("DETAILED CARD VALUES", color=TerminalColors.BRIGHT_MAGENTA)
-                    for card in player.hand:
-                        print(f"\n{card.get_detailed_description()}")
-                    continue
-                elif choice.lower() == 'ranking':
-                    print(Deck.get_card_rank_explanation())
-                    continue
-                
-                # Try to convert to integer, skip if empty or invalid
-                if not choice:
-                    continue
-                choice = int(choice)
+                # AI response to the bet
+                ai_response = self.ai_respond_to_bet(game, new_bet)
                 
-                if choice == 1:
-                    # Continue without betting
-                    print("➡️ Continuing without betting.")
-                    valid_choice = True
-                elif choice == 2 and len(bet_options) > 1:
-                    # Make a bet
-                    new_bet = bet_options[1]
-                    print(f"\n🎯 You called {new_bet}!")
-                    
-                    # AI response to the bet
-                    ai_response = self.ai_respond_to_bet(game, new_bet)
+                # Nothing outranks Vale Cuatro, so a raise there can only mean accepting it
+                if ai_response == "accept" or (ai_response == "raise" and new_bet == BetState.VALE_CUATRO):
+                    # Get a random opponent to respond
+                    ai_player = game.teams[1].first_ai
+                    if ai_player:
+                        comment = CommentGenerator.get_comment("accept_bet", ai_player.personality, game.rng)
+                        self.display_manager.emit(f"{ai_player.name}: {comment}")
+                    self.display_manager.emit("✅ Opponent accepts your bet!")
                     
-                    if ai_response == "accept":
-                        # Get a random opponent to respond
-                        ai_player = next((p for p in game.teams[1].players if not p.is_human), None)
-                        if ai_player:
-                            comment = CommentGenerator.get_comment("accept_bet", ai_player.personality)
-                            print(f"{ai_player.name}: {comment}")
-                        print("✅ Opponent accepts your bet!")
-                        
-                        game.current_bet = new_bet
-                        if new_bet == "Truco":
-                            game.bet_value = 2
-                        elif new_bet == "Retruco":
-                            game.bet_value = 3
-                        elif new_bet == "Vale Cuatro":
-                            game.bet_value = 4
-                    elif ai_response == "raise":
-                        if new_bet == "Truco":
-                            # Get a random opponent to respond
-                            ai_player = next((p for p in game.teams[1].players if not p.is_human), None)
-                            if ai_player:
-                                comment = CommentGenerator.get_comment("retruco_call", ai_player.personality)
-                                print(f"{ai_player.name}: {comment}")
-                            print("⬆️ Opponent raises to Retruco!")
-                            # Ask player to accept, raise to Vale Cuatro, or fold
-                            return self.handle_player_bet_response(game, "Retruco")
-                        elif new_bet == "Retruco":
-                            # Get a random opponent to respond
-                            ai_player = next((p for p in game.teams[1].players if not p.is_human), None)
-                            if ai_player:
-                                comment = CommentGenerator.get_comment("vale_cuatro_call", ai_player.personality)
-                                print(f"{ai_player.name}: {comment}")
-                            print("⬆️ Opponent raises to Vale Cuatro!")
-                            # Ask player to accept or fold
-                            return self.handle_player_bet_response(game, "Vale Cuatro")
-                    elif ai_response == "decline":
+                    game.current_bet = new_bet
+                    game.bet_value = _BET_POINTS[new_bet]
+                elif ai_response == "raise":
+                    if new_bet != BetState.VALE_CUATRO:
+                        raised_bet = BetState(new_bet + 1)
                         # Get a random opponent to respond
-                        ai_player = next((p for p in game.teams[1].players if not p.is_human), None)
+                        ai_player = game.teams[1].first_ai
                         if ai_player:
-                            comment = CommentGenerator.get_comment("decline_bet", ai_player.personality)
-                            print(f"{ai_player.name}: {comment}")
-                        print("❌ Opponent declines your bet! You win this hand.")
-                        
-                        game.teams[0].add_score(1 if game.current_bet == "No bet" else game.bet_value)
-                        self.display_manager.show_celebration(game.teams[0].name, 1 if game.current_bet == "No bet" else game.bet_value, True)
-                        return True  # Early end to hand
+                            comment = CommentGenerator.get_comment(_BET_CALL_COMMENTS[raised_bet], ai_player.personality, game.rng)
+                            self.display_manager.emit(f"{ai_player.name}: {comment}")
+                        self.display_manager.emit(f"⬆️ Opponent raises to {_BET_NAMES[raised_bet]}!")
+                        # Ask player to accept, raise further, or fold
+                        return self.handle_player_bet_response(game, raised_bet)
+                elif ai_response == "decline":
+                    # Get a random opponent to respond
+                    ai_player = game.teams[1].first_ai
+                    if ai_player:
+                        comment = CommentGenerator.get_comment("decline_bet", ai_player.personality, game.rng)
+                        self.display_manager.emit(f"{ai_player.name}: {comment}")
+                    self.display_manager.emit("❌ Opponent declines your bet! You win this hand.")
                     
-                    valid_choice = True
-                elif choice == 3:
-                    # Show betting advice
-                    advice = CardAdvisor.get_betting_advice(player.hand, game.current_bet, False, self.display_manager)
-                    print(f"\n{advice}")
-                else:
-                    print("❌ Invalid choice. Please try again.")
-            except ValueError:
-                if choice.strip():  # Only show error for non-empty input
-                    print("❌ Please enter a valid number or command.")
+                    game.teams[0].add_score(game.bet_value)
+                    self.display_manager.show_celebration(game.teams[0].name, game.bet_value, True)
+                    return True  # Early end to hand
+                
+                valid_choice = True
+            elif choice == 3:
+                # Show betting advice
+                advice = CardAdvisor.get_betting_advice(player.hand, _BET_NAMES[game.current_bet], False, self.display_manager)
+                self.display_manager.emit(f"\n{advice}")
+            else:
+                self.display_manager.emit("❌ Invalid choice. Please try again.")
         
         return False  # Continue hand
     
@@ -1386,46 +1693,30 @@ class TrucoBetting(BettingSystem):
 
     def handle_ai_truco_betting(self, game, player):
         """Handle AI betting decisions"""
-        # Simple AI betting strategy based on hand strength
-        hand_strength = sum(card.value for card in player.hand)
-        
-        # Decide to make a bet based on hand strength and personality
-        bluff_threshold = 0.2  # Default bluff probability
-        if player.personality == "bluffer":
-            bluff_threshold = 0.4  # Bluffers bluff more
-        elif player.personality == "cautious":
-            bluff_threshold = 0.1  # Cautious players bluff less
-        elif player.personality == "aggressive":
-            bluff_threshold = 0.3  # Aggressive players bluff more
-        
-        # Based on hand strength, decide whether to bet
-        if hand_strength > 25 or random.random() < bluff_threshold:  # Sometimes bluff
-            if game.current_bet == "No bet":
-                new_bet = "Truco"
-                comment = CommentGenerator.get_comment("truco_call", player.personality)
-                print(f"{player.name}: {comment}")
-                print(f"\n🤖 {player.name} calls Truco!")
-                
-                # Ask human to respond
-                return self.handle_player_bet_response(game, "Truco", player)
-                
-            elif game.current_bet == "Truco" and (hand_strength > 30 or random.random() < bluff_threshold/2):
-                new_bet = "Retruco"
-                comment = CommentGenerator.get_comment("retruco_call", player.personality)
-                print(f"{player.name}: {comment}")
-                print(f"\n🤖 {player.name} calls Retruco!")
-                
-                # Ask human to respond
-                return self.handle_player_bet_response(game, "Retruco", player)
-                
-            elif game.current_bet == "Retruco" and (hand_strength > 35 or random.random() < bluff_threshold/3):
-                new_bet = "Vale Cuatro"
-                comment = CommentGenerator.get_comment("vale_cuatro_call", player.personality)
-                print(f"{player.name}: {comment}")
-                print(f"\n🤖 {player.name} calls Vale Cuatro!")
-                
-                # Ask human to respond
-                return self.handle_player_bet_response(game, "Vale Cuatro", player)
+        # Search the rest of the hand for how likely the AI's team is to win it
+        outlook = TrucoSearch.estimate(game, player, game.rng)
+        
+        # Decide to make a bet based on the outlook and personality
+        bluff_threshold = _BLUFF_THRESHOLDS.get(player.personality) or _BLUFF_THRESHOLDS["default"]
+        rng = game.rng
+        
+        # Higher bets need a clearer edge; otherwise only a bluff makes the call
+        if outlook > 0.2 or _coin(bluff_threshold, rng):  # Sometimes bluff
+            if game.current_bet == BetState.NONE:
+                new_bet = BetState.TRUCO
+            elif game.current_bet == BetState.TRUCO and (outlook > 0.4 or _coin(bluff_threshold // 2, rng)):
+                new_bet = BetState.RETRUCO
+            elif game.current_bet == BetState.RETRUCO and (outlook > 0.6 or _coin(bluff_threshold // 3, rng)):
+                new_bet = BetState.VALE_CUATRO
+            else:
+                return False  # Continue hand
+            
+            comment = CommentGenerator.get_comment(_BET_CALL_COMMENTS[new_bet], player.personality, game.rng)
+            self.display_manager.emit(f"{player.name}: {comment}")
+            self.display_manager.emit(f"\n🤖 {player.name} calls {_BET_NAMES[new_bet]}!")
+            
+            # Ask human to respond
+            return self.handle_player_bet_response(game, new_bet, player)
         
         return False  # Continue hand
     
@@ -1433,135 +1724,81 @@ class TrucoBetting(BettingSystem):
         """Handle the player's response to an AI bet"""
         self.display_manager.section("RESPOND TO BET", color=TerminalColors.BRIGHT_RED)
         
-        if bet == "Truco":
-            print("1. ✅ Accept (play for 2 points)")
-            print("2. ⬆️ Raise to Retruco (3 points)")
-            print("3. ❌ Decline (opponent gets 1 point)")
-            print("4. 💡 Get betting advice")
-            max_choice = 4
-        elif bet == "Retruco":
-            print("1. ✅ Accept (play for 3 points)")
-            print("2. ⬆️ Raise to Vale Cuatro (4 points)")
-            print("3. ❌ Decline (opponent gets 2 points)")
-            print("4. 💡 Get betting advice")
-            max_choice = 4
-        elif bet == "Vale Cuatro":
-            print("1. ✅ Accept (play for 4 points)")
-            print("2. ❌ Decline (opponent gets 3 points)")
-            print("3. 💡 Get betting advice")
-            max_choice = 3
-            
+        prompt, actions = _RESPONSE_MENUS[bet]
+        self.display_manager.emit(prompt)
+        
         # Find the human player
-        human_player = next((p for p in game.players if p.is_human), None)
+        human_player = game.human_player
         
         valid_choice = False
         while not valid_choice:
-            try:
-                choice = input("\n🔢 Enter your choice: ").strip()
-                
-                # Check for help commands
-                if choice.lower() in ['help', 'h', '?']:
-                    game.tutorial_manager.show_help_during_game()
-                    continue
-                elif choice.lower() == 'advisor':
-                    is_first_player = len(game.round_cards) == 0
-                    advice = CardAdvisor.get_play_advice(human_player.hand, game.round_cards, is_first_player, self.display_manager)
-                    print(advice)
-                    continue
-                elif choice.lower() == 'values':
-                    # Display detailed card information
-                    self.display_manager.section("DETAILED CARD VALUES", color=TerminalColors.BRIGHT_MAGENTA)
-                    for card in human_player.hand:
-                        print(f"\n{card.get_detailed_description()}")
-                    continue
-                elif choice.lower() == 'ranking':
-                    print(Deck.get_card_rank_explanation())
-                    continue
-                
-                # Skip empty input
-                if not choice:
-                    continue
-                choice = int(choice)
-                
-                if bet == "Vale Cuatro":
-                    # Adjust choice for Vale Cuatro (only 3 options)
-                    if choice == 3:
-                        # Show betting advice
-                        advice = CardAdvisor.get_betting_advice(human_player.hand, bet, True, self.display_manager)
-                        print(f"\n{advice}")
-                        continue
-                
-                if 1 <= choice <= max_choice:
-                    if choice == 1:  # Accept
-                        print(f"✅ You accept the {bet}!")
-                        game.current_bet = bet
-                        if bet == "Truco":
-                            game.bet_value = 2
-                        elif bet == "Retruco":
-                            game.bet_value = 3
-                        elif bet == "Vale Cuatro":
-                            game.bet_value = 4
-                    elif choice == 2:
-                        if bet != "Vale Cuatro":  # Raise
-                            new_bet = "Retruco" if bet == "Truco" else "Vale Cuatro"
-                            print(f"⬆️ You raise to {new_bet}!")
-                            
-                            # AI responds to the raise
-                            ai_response = self.ai_respond_to_bet(game, new_bet, betting_player)
-                            
-                            if ai_response == "accept":
-                                # Get response from the betting player if available
-                                if betting_player:
-                                    comment = CommentGenerator.get_comment("accept_bet", betting_player.personality)
-                                    print(f"{betting_player.name}: {comment}")
-                                print(f"✅ Opponent accepts your {new_bet}!")
-                                
-                                game.current_bet = new_bet
-                                game.bet_value = 3 if new_bet == "Retruco" else 4
-                            elif ai_response == "decline":
-                                # Get response from the betting player if available
-                                if betting_player:
-                                    comment = CommentGenerator.get_comment("decline_bet", betting_player.personality)
-                                    print(f"{betting_player.name}: {comment}")
-                                print(f"❌ Opponent declines your {new_bet}! You win this hand.")
-                                
-                                game.teams[0].add_score(2 if new_bet == "Retruco" else 3)
-                                self.display_manager.show_celebration(game.teams[0].name, 2 if new_bet == "Retruco" else 3, True)
-                                return True  # End hand early
-                        else:  # Decline Vale Cuatro
-                            print("❌ You decline the Vale Cuatro. Opponent wins this hand.")
-                            game.teams[1].add_score(3)  # Opponent team gets 3 points
-                            self.display_manager.show_celebration(game.teams[1].name, 3, True)
-                            return True  # End hand early
-                    elif choice == 3:
-                        if bet != "Vale Cuatro":  # Decline Truco or Retruco
-                            print(f"❌ You decline the {bet}. Opponent wins this hand.")
-                            points = 1 if bet == "Truco" else (2 if bet == "Retruco" else 3)
-                            game.teams[1].add_score(points)
-                            self.display_manager.show_celebration(game.teams[1].name, points, True)
-                            return True  # End hand early
-                        else:  # Show betting advice for Vale Cuatro
-                            advice = CardAdvisor.get_betting_advice(human_player.hand, bet, True, self.display_manager)
-                            print(f"\n{advice}")
-                            continue
-                    elif choice == 4:  # Show betting advice
-                        advice = CardAdvisor.get_betting_advice(human_player.hand, bet, True, self.display_manager)
-                        print(f"\n{advice}")
-                        continue
+            choice = self._read_menu_choice(game, human_player, "\n🔢 Enter your choice: ")
+            if choice is None:
+                continue
+            
+            if 1 <= choice <= len(actions):
+                action = actions[choice - 1]
+                if action == "accept":
+                    self.display_manager.emit(f"✅ You accept the {_BET_NAMES[bet]}!")
+                    game.current_bet = bet
+                    game.bet_value = _BET_POINTS[bet]
+                elif action == "raise":
+                    new_bet = BetState(bet + 1)
+                    self.display_manager.emit(f"⬆️ You raise to {_BET_NAMES[new_bet]}!")
+                    
+                    # AI responds to the raise
+                    ai_response = self.ai_respond_to_bet(game, new_bet, betting_player)
+                    
+                    if ai_response == "raise" and new_bet != BetState.VALE_CUATRO:
+                        raised_bet = BetState(new_bet + 1)
+                        # Get response from the betting player if available
+                        if betting_player:
+                            comment = CommentGenerator.get_comment(_BET_CALL_COMMENTS[raised_bet], betting_player.personality, game.rng)
+                            self.display_manager.emit(f"{betting_player.name}: {comment}")
+                        self.display_manager.emit(f"⬆️ Opponent raises to {_BET_NAMES[raised_bet]}!")
+                        # Ask player to accept, raise further, or fold
+                        return self.handle_player_bet_response(game, raised_bet, betting_player)
+                    elif ai_response == "accept" or ai_response == "raise":
+                        # Get response from the betting player if available
+                        if betting_player:
+                            comment = CommentGenerator.get_comment("accept_bet", betting_player.personality, game.rng)
+                            self.display_manager.emit(f"{betting_player.name}: {comment}")
+                        self.display_manager.emit(f"✅ Opponent accepts your {_BET_NAMES[new_bet]}!")
                         
-                    valid_choice = True
-                else:
-                    print("❌ Invalid choice. Please try again.")
-            except ValueError:
-                if choice.strip():  # Only show error for non-empty input
-                    print("❌ Please enter a valid number or command.")
+                        game.current_bet = new_bet
+                        game.bet_value = _BET_POINTS[new_bet]
+                    elif ai_response == "decline":
+                        # Get response from the betting player if available
+                        if betting_player:
+                            comment = CommentGenerator.get_comment("decline_bet", betting_player.personality, game.rng)
+                            self.display_manager.emit(f"{betting_player.name}: {comment}")
+                        self.display_manager.emit(f"❌ Opponent declines your {_BET_NAMES[new_bet]}! You win this hand.")
+                        
+                        # Declining a raise concedes the bet that was on the table
+                        game.teams[0].add_score(_BET_POINTS[bet])
+                        self.display_manager.show_celebration(game.teams[0].name, _BET_POINTS[bet], True)
+                        return True  # End hand early
+                elif action == "decline":
+                    self.display_manager.emit(f"❌ You decline the {_BET_NAMES[bet]}. Opponent wins this hand.")
+                    points = _BET_POINTS[bet] - 1  # Value of the previous bet level
+                    game.teams[1].add_score(points)
+                    self.display_manager.show_celebration(game.teams[1].name, points, True)
+                    return True  # End hand early
+                else:  # Show betting advice
+                    advice = CardAdvisor.get_betting_advice(human_player.hand, _BET_NAMES[bet], True, self.display_manager)
+                    self.display_manager.emit(f"\n{advice}")
+                    continue
+                    
+                valid_choice = True
+            else:
+                self.display_manager.emit("❌ Invalid choice. Please try again.")
         
         return False  # Continue hand
     
     def ai_respond_to_bet(self, game, bet, original_better=None):
         """Determine how AI responds to a bet"""
         # Get a random AI player from team 2
-        ai_players = [p for p in game.teams[1].players if not p.is_human]
+        ai_players = game.teams[1].ai_players
         if not ai_players:
             return "accept"  # Fallback
             
@@ -1569,47 +1806,19 @@ class TrucoBetting(BettingSystem):
         if original_better and original_better in ai_players:
             ai_player = original_better
         else:
-            ai_player = random.choice(ai_players)
+            ai_player = game.rng.choice(ai_players)
         
-        # Calculate hand strength
-        hand_strength = sum(card.value for card in ai_player.hand)
-        
-        # Adjust thresholds based on personality
-        raise_threshold = 0.1  # Default raise probability
-        accept_threshold = 0.7  # Default accept probability
-        
-        if ai_player.personality == "aggressive":
-            raise_threshold = 0.25
-            accept_threshold = 0.8
-        elif ai_player.personality == "cautious":
-            raise_threshold = 0.05
-            accept_threshold = 0.6
-        elif ai_player.personality == "bluffer":
-            raise_threshold = 0.15
-            accept_threshold = 0.75
-        
-        # Respond based on hand strength and randomness (for bluffing)
-        if bet == "Truco":
-            if hand_strength > 25 or random.random() < raise_threshold:  # chance to bluff and raise
-                return "raise"
-            elif hand_strength > 20 or random.random() < accept_threshold:  # chance to accept with medium hand
-                return "accept"
-            else:
-                return "decline"
-        elif bet == "Retruco":
-            if hand_strength > 30 or random.random() < raise_threshold/2:  # chance to bluff and raise
-                return "raise"
-            elif hand_strength > 25 or random.random() < accept_threshold-0.1:  # chance to accept with good hand
-                return "accept"
-            else:
-                return "decline"
-        elif bet == "Vale Cuatro":
-            if hand_strength > 30 or random.random() < accept_threshold-0.2:  # chance to accept with strong hand
-                return "accept"
-            else:
-                return "decline"
+        if bet == BetState.NONE:
+            return "accept"  # Default fallback
+        
+        # Adjust the bluff chance based on personality
+        raise_threshold = (_TRUCO_RAISE_BLUFFS.get(ai_player.personality) or _TRUCO_RAISE_BLUFFS["default"])[bet]
+        raise_stake = _BET_POINTS[bet + 1] if bet < BetState.VALE_CUATRO else None
         
-        return "accept"  # Default fallback
+        # Weigh the answer over sampled deals of the hidden cards
+        scores = TrucoSearch.truco_scores(game, ai_player, game.rng)
+        choice = _search_response(scores, _BET_POINTS[bet], raise_stake, _BET_POINTS[bet - 1], raise_threshold, game.rng)
+        return _TRUCO_RESPONSES[choice]
 
 
 class EnvidoBetting(BettingSystem):
@@ -1622,7 +1831,7 @@ class EnvidoBetting(BettingSystem):
             return False
             
         # Find the human player
-        human_player = next((p for p in game.players if p.is_human), None)
+        human_player = game.human_player
         if not human_player:
             return False
             
@@ -1630,124 +1839,94 @@ class EnvidoBetting(BettingSystem):
         current_player_index = game.current_player_index
         
         # Display Envido points for human player
-        envido_points = human_player.calculate_envido_points()
+        envido_points = human_player.envido_points
         
         self.display_manager.section("ENVIDO PHASE", color=TerminalColors.BRIGHT_GREEN)
-        print(f"Your Envido points: {envido_points}")
+        self.display_manager.emit(f"Your Envido points: {envido_points}")
         
         # Determine if AI will call Envido
         ai_called_envido = False
         if current_player_index != 0:  # AI plays first
             ai_player = game.players[current_player_index]
-            ai_points = ai_player.calculate_envido_points()
+            ai_points = ai_player.envido_points
             
             # Determine bluffing probability based on personality
-            bluff_threshold = 0.3  # Default probability
-            if ai_player.personality == "bluffer":
-                bluff_threshold = 0.5
-            elif ai_player.personality == "cautious":
-                bluff_threshold = 0.15
-            elif ai_player.personality == "aggressive":
-                bluff_threshold = 0.4
+            bluff_threshold = _ENVIDO_BLUFF_THRESHOLDS.get(ai_player.personality) or _ENVIDO_BLUFF_THRESHOLDS["default"]
                 
             # AI is more likely to call Envido with higher points
-            if ai_points > 25 or random.random() < bluff_threshold:  # 30% chance to bluff
-                comment = CommentGenerator.get_comment("envido_call", ai_player.personality)
-                print(f"{ai_player.name}: {comment}")
-                print(f"\n🤖 {ai_player.name} calls Envido!")
+            if ai_points > 25 or _coin(bluff_threshold, game.rng):  # 30% chance to bluff by default
+                comment = CommentGenerator.get_comment("envido_call", ai_player.personality, game.rng)
+                self.display_manager.emit(f"{ai_player.name}: {comment}")
+                self.display_manager.emit(f"\n🤖 {ai_player.name} calls Envido!")
                 ai_called_envido = True
-                return self.handle_player_envido_response(game, "Envido", ai_player)
+                return self.handle_player_envido_response(game, EnvidoBet.ENVIDO, ai_player)
         
         if not ai_called_envido:
             # Ask human if they want to call Envido
             self.display_manager.section("ENVIDO OPTIONS", color=TerminalColors.BRIGHT_GREEN)
             
-            print("1. ➡️ Continue without calling Envido")
-            print("2. 🎲 Call Envido (2 points)")
-            print("3. 💡 Get Envido advice")
+            self.display_manager.emit(
+                "1. ➡️ Continue without calling Envido",
+                "2. 🎲 Call Envido (2 points)",
+                "3. 💡 Get Envido advice",
+            )
             
             valid_choice = False
             while not valid_choice:
-                try:
-                    choice = input("\n💬 Do you want to call Envido? Enter your choice: ").strip()
-                    
-                    # Check for help commands
-                    if choice.lower() in ['help', 'h', '?']:
-                        game.tutorial_manager.show_help_during_game()
-                        continue
-                    elif choice.lower() == 'advisor':
-                        is_first_player = len(game.round_cards) == 0
-                        advice = CardAdvisor.get_play_advice(human_player.hand, game.round_cards, is_first_player, self.display_manager)
-                        print(advice)
-                        continue
-                    elif choice.lower() == 'values':
-                        # Display detailed card information
-                        self.display_manager.section("DETAILED CARD VALUES", color=TerminalColors.BRIGHT_MAGENTA)
-                        for card in human_player.hand:
-                            print(f"\n{card.get_detailed_description()}")
-                        continue
-                    elif choice.lower() == 'ranking':
-                        print(Deck.get_card_rank_explanation())
-                        continue
+                choice = self._read_menu_choice(game, human_player, "\n💬 Do you want to call Envido? Enter your choice: ")
+                if choice is None:
+                    continue
+                
+                if choice == 1:
+                    # Continue without calling Envido
+                    self.display_manager.emit("➡️ Continuing without calling Envido.")
+                    valid_choice = True
+                elif choice == 2:
+                    # Call Envido
+                    self.display_manager.emit(f"\n🎯 You called Envido!")
                     
-                    # Skip empty input
-                    if not choice:
-                        continue
-                    choice = int(choice)
+                    # AI response to Envido
+                    ai_response = self.ai_respond_to_envido(game, EnvidoBet.ENVIDO)
                     
-                    if choice == 1:
-                        # Continue without calling Envido
-                        print("➡️ Continuing without calling Envido.")
-                        valid_choice = True
-                    elif choice == 2:
-                        # Call Envido
-                        print(f"\n🎯 You called Envido!")
+                    if ai_response == "accept" or ai_response == "quiero":
+                        # Get a random AI player to respond
+                        ai_player = game.teams[1].first_ai
+                        if ai_player:
+                            comment = CommentGenerator.get_comment("accept_bet", ai_player.personality, game.rng)
+                            self.display_manager.emit(f"{ai_player.name}: {comment}")
+                        self.display_manager.emit("✅ Opponent accepts your Envido!")
+                        # Compare Envido points
+                        return self.compare_envido_points(game)
                         
-                        # AI response to Envido
-                        ai_response = self.ai_respond_to_envido(game, "Envido")
+                    elif ai_response == "raise":
+                        # Get a random AI player to respond
+                        ai_player = game.teams[1].first_ai
+                        if ai_player:
+                            comment = CommentGenerator.get_comment("real_envido_call", ai_player.personality, game.rng)
+                            self.display_manager.emit(f"{ai_player.name}: {comment}")
+                        self.display_manager.emit("⬆️ Opponent raises to Real Envido!")
+                        # Ask player to accept, raise to Falta Envido, or decline
+                        return self.handle_player_envido_response(game, EnvidoBet.REAL_ENVIDO, ai_player)
                         
-                        if ai_response == "accept" or ai_response == "quiero":
-                            # Get a random AI player to respond
-                            ai_player = next((p for p in game.teams[1].players if not p.is_human), None)
-                            if ai_player:
-                                comment = CommentGenerator.get_comment("accept_bet", ai_player.personality)
-                                print(f"{ai_player.name}: {comment}")
-                            print("✅ Opponent accepts your Envido!")
-                            # Compare Envido points
-                            return self.compare_envido_points(game)
-                            
-                        elif ai_response == "raise":
-                            # Get a random AI player to respond
-                            ai_player = next((p for p in game.teams[1].players if not p.is_human), None)
-                            if ai_player:
-                                comment = CommentGenerator.get_comment("real_envido_call", ai_player.personality)
-                                print(f"{ai_player.name}: {comment}")
-                            print("⬆️ Opponent raises to Real Envido!")
-                            # Ask player to accept, raise to Falta Envido, or decline
-                            return self.handle_player_envido_response(game, "Real Envido", ai_player)
-                            
-                        elif ai_response == "decline":
-                            # Get a random AI player to respond
-                            ai_player = next((p for p in game.teams[1].players if not p.is_human), None)
-                            if ai_player:
-                                comment = CommentGenerator.get_comment("decline_bet", ai_player.personality)
-                                print(f"{ai_player.name}: {comment}")
-                            print("❌ Opponent declines your Envido! You win 1 point.")
-                            
-                            game.teams[0].add_score(1)
-                            self.display_manager.show_celebration(game.teams[0].name, 1, True)
-                            return True  # End hand early
+                    elif ai_response == "decline":
+                        # Get a random AI player to respond
+                        ai_player = game.teams[1].first_ai
+                        if ai_player:
+                            comment = CommentGenerator.get_comment("decline_bet", ai_player.personality, game.rng)
+                            self.display_manager.emit(f"{ai_player.name}: {comment}")
+                        self.display_manager.emit("❌ Opponent declines your Envido! You win 1 point.")
                         
-                        valid_choice = True
-                    elif choice == 3:
-                        # Show Envido advice
-                        advice = CardAdvisor.get_envido_advice(human_player.hand, self.display_manager)
-                        print(f"\n{advice}")
-                    else:
-                        print("❌ Invalid choice. Please try again.")
-                except ValueError:
-                    if choice.strip():  # Only show error for non-empty input
-                        print("❌ Please enter a valid number or command.")
+                        game.teams[0].add_score(1)
+                        self.display_manager.show_celebration(game.teams[0].name, 1, True)
+                        return True  # End hand early
+                    
+                    valid_choice = True
+                elif choice == 3:
+                    # Show Envido advice
+                    advice = CardAdvisor.get_envido_advice(human_player.hand, self.display_manager)
+                    self.display_manager.emit(f"\n{advice}")
+                else:
+                    self.display_manager.emit("❌ Invalid choice. Please try again.")
         
         return False  # Continue hand
 
@@ -1756,161 +1935,81 @@ class EnvidoBetting(BettingSystem):
         self.display_manager.section("RESPOND TO ENVIDO", color=TerminalColors.BRIGHT_GREEN)
         
         # Find the human player
-        human_player = next((p for p in game.players if p.is_human), None)
-        
-        if bet == "Envido":
-            print("1. ✅ Accept (play for 2 points)")
-            print("2. ⬆️ Raise to Real Envido (3 more points)")
-            print("3. 🚀 Raise to Falta Envido (enough to win)")
-            print("4. ❌ Decline (opponent gets 1 point)")
-            print("5. 💡 Get Envido advice")
-            max_choice = 5
-        elif bet == "Real Envido":
-            print("1. ✅ Accept (play for 3 more points)")
-            print("2. 🚀 Raise to Falta Envido (enough to win)")
-            print("3. ❌ Decline (opponent gets previous points)")
-            print("4. 💡 Get Envido advice")
-            max_choice = 4
-        elif bet == "Falta Envido":
-            print("1. ✅ Accept (play for enough points to win)")
-            print("2. ❌ Decline (opponent gets previous points)")
-            print("3. 💡 Get Envido advice")
-            max_choice = 3
-            
+        human_player = game.human_player
+        
+        prompt, actions = _ENVIDO_RESPONSE_MENUS[bet]
+        self.display_manager.emit(prompt)
+        
         valid_choice = False
         while not valid_choice:
-            try:
-                choice = input("\n🔢 Enter your choice: ").strip()
-                
-                # Check for help commands
-                if choice.lower() in ['help', 'h', '?']:
-                    game.tutorial_manager.show_help_during_game()
-                    continue
-                elif choice.lower() == 'advisor':
-                    is_first_player = len(game.round_cards) == 0
-                    advice = CardAdvisor.get_play_advice(human_player.hand, game.round_cards, is_first_player, self.display_manager)
-                    print(advice)
-                    continue
-                elif choice.lower() == 'values':
-                    # Display detailed card information
-                    self.display_manager.section("DETAILED CARD VALUES", color=TerminalColors.BRIGHT_MAGENTA)
-                    for card in human_player.hand:
-                        print(f"\n{card.get_detailed_description()}")
-                    continue
-                elif choice.lower() == 'ranking':
-                    print(Deck.get_card_rank_explanation())
-                    continue
-                
-                # Skip empty input
-                if not choice:
-                    continue
-                choice = int(choice)
-                
-                if 1 <= choice <= max_choice:
-                    if choice == 1:  # Accept
-                        print(f"✅ You accept the {bet}!")
+            choice = self._read_menu_choice(game, human_player, "\n🔢 Enter your choice: ")
+            if choice is None:
+                continue
+            
+            if 1 <= choice <= len(actions):
+                action = actions[choice - 1]
+                if action == "accept":
+                    self.display_manager.emit(f"✅ You accept the {_ENVIDO_NAMES[bet]}!")
+                    # Compare Envido points
+                    return self.compare_envido_points(game, bet)
+                elif action == "raise" or action == "falta":
+                    if action == "falta":
+                        new_bet = EnvidoBet.FALTA_ENVIDO
+                        self.display_manager.emit("🚀 You raise to Falta Envido!")
+                    else:
+                        new_bet = EnvidoBet(bet + 1)
+                        self.display_manager.emit(f"⬆️ You raise to {_ENVIDO_NAMES[new_bet]}!")
+                    
+                    # AI responds to the raise
+                    ai_response = self.ai_respond_to_envido(game, new_bet, betting_player)
+                    
+                    if ai_response == "raise" and new_bet != EnvidoBet.FALTA_ENVIDO:
+                        raised_bet = EnvidoBet(new_bet + 1)
+                        self.display_manager.emit(f"⬆️ Opponent raises to {_ENVIDO_NAMES[raised_bet]}!")
+                        # Ask player to accept, raise further, or decline
+                        return self.handle_player_envido_response(game, raised_bet, betting_player)
+                    elif ai_response in ("accept", "quiero", "raise"):
+                        # Get response from the betting player if available
+                        if betting_player:
+                            comment = CommentGenerator.get_comment("accept_bet", betting_player.personality, game.rng)
+                            self.display_manager.emit(f"{betting_player.name}: {comment}")
+                        self.display_manager.emit(f"✅ Opponent accepts your {_ENVIDO_NAMES[new_bet]}!")
+                        
                         # Compare Envido points
-                        return self.compare_envido_points(game, bet)
-                    elif choice == 2:
-                        if bet != "Falta Envido":  # Raise
-                            new_bet = "Real Envido" if bet == "Envido" else "Falta Envido"
-                            print(f"⬆️ You raise to {new_bet}!")
-                            
-                            # AI responds to the raise
-                            ai_response = self.ai_respond_to_envido(game, new_bet, betting_player)
-                            
-                            if ai_response == "accept" or ai_response == "quiero":
-                                # Get response from the betting player if available
-                                if betting_player:
-                                    comment = CommentGenerator.get_comment("accept_bet", betting_player.personality)
-                                    print(f"{betting_player.name}: {comment}")
-                                print(f"✅ Opponent accepts your {new_bet}!")
-                                
-                                # Compare Envido points
-                                return self.compare_envido_points(game, new_bet)
-                            elif ai_response == "decline":
-                                # Get response from the betting player if available
-                                if betting_player:
-                                    comment = CommentGenerator.get_comment("decline_bet", betting_player.personality)
-                                    print(f"{betting_player.name}: {comment}")
-                                print(f"❌ Opponent declines your {new_bet}!")
-                                
-                                points = 2 if bet == "Envido" else 3
-                                game.teams[0].add_score(points)
-                                self.display_manager.show_celebration(game.teams[0].name, points, True)
-                                return True  # End hand early
-                        else:  # Decline Falta Envido
-                            print("❌ You decline the Falta Envido.")
-                            points = 3  # Points from previous Real Envido
-                            game.teams[1].add_score(points)
-                            self.display_manager.show_celebration(game.teams[1].name, points, True)
-                            return True  # End hand early
-                    elif choice == 3:
-                        if bet == "Envido":  # Raise to Falta Envido
-                            print("🚀 You raise to Falta Envido!")
-                            
-                            # AI responds to Falta Envido
-                            ai_response = self.ai_respond_to_envido(game, "Falta Envido", betting_player)
-                            
-                            if ai_response == "accept" or ai_response == "quiero":
-                                # Get response from the betting player if available
-                                if betting_player:
-                                    comment = CommentGenerator.get_comment("accept_bet", betting_player.personality)
-                                    print(f"{betting_player.name}: {comment}")
-                                print(f"✅ Opponent accepts your Falta Envido!")
-                                
-                                # Compare Envido points
-                                return self.compare_envido_points(game, "Falta Envido")
-                            elif ai_response == "decline":
-                                # Get response from the betting player if available
-                                if betting_player:
-                                    comment = CommentGenerator.get_comment("decline_bet", betting_player.personality)
-                                    print(f"{betting_player.name}: {comment}")
-                                print(f"❌ Opponent declines your Falta Envido!")
-                                
-                                points = 2  # Points from previous Envido
-                                game.teams[0].add_score(points)
-                                self.display_manager.show_celebration(game.teams[0].name, points, True)
-                                return True  # End hand early
-                        elif bet == "Real Envido":  # Decline Real Envido
-                            print("❌ You decline the Real Envido.")
-                            points = 1  # Points from previous Envido
-                            game.teams[1].add_score(points)
-                            self.display_manager.show_celebration(game.teams[1].name, points, True)
-                            return True  # End hand early
-                        else:  # Get Envido advice
-                            advice = CardAdvisor.get_envido_advice(human_player.hand, self.display_manager)
-                            print(f"\n{advice}")
-                            continue
-                    elif choice == 4:
-                        if bet == "Envido":  # Decline Envido
-                            print("❌ You decline the Envido.")
-                            points = 1
-                            game.teams[1].add_score(points)
-                            self.display_manager.show_celebration(game.teams[1].name, points, True)
-                            return True  # End hand early
-                        else:  # Get Envido advice
-                            advice = CardAdvisor.get_envido_advice(human_player.hand, self.display_manager)
-                            print(f"\n{advice}")
-                            continue
-                    elif choice == 5:  # Get Envido advice
-                        advice = CardAdvisor.get_envido_advice(human_player.hand, self.display_manager)
-                        print(f"\n{advice}")
-                        continue
+                        return self.compare_envido_points(game, new_bet)
+                    elif ai_response == "decline":
+                        # Get response from the betting player if available
+                        if betting_player:
+                            comment = CommentGenerator.get_comment("decline_bet", betting_player.personality, game.rng)
+                            self.display_manager.emit(f"{betting_player.name}: {comment}")
+                        self.display_manager.emit(f"❌ Opponent declines your {_ENVIDO_NAMES[new_bet]}!")
                         
-                    valid_choice = True
-                else:
-                    print("❌ Invalid choice. Please try again.")
-            except ValueError:
-                if choice.strip():  # Only show error for non-empty input
-                    print("❌ Please enter a valid number or command.")
+                        # Declining a raise concedes the bet that was on the table
+                        points = _ENVIDO_POINTS[bet]
+                        game.teams[0].add_score(points)
+                        self.display_manager.show_celebration(game.teams[0].name, points, True)
+                        return True  # End hand early
+                elif action == "decline":
+                    self.display_manager.emit(f"❌ You decline the {_ENVIDO_NAMES[bet]}.")
+                    points = _ENVIDO_DECLINE_POINTS[bet]
+                    game.teams[1].add_score(points)
+                    self.display_manager.show_celebration(game.teams[1].name, points, True)
+                    return True  # End hand early
+                else:  # Get Envido advice
+                    advice = CardAdvisor.get_envido_advice(human_player.hand, self.display_manager)
+                    self.display_manager.emit(f"\n{advice}")
+                    continue
+                    
+                valid_choice = True
+            else:
+                self.display_manager.emit("❌ Invalid choice. Please try again.")
         
         return False  # Continue hand
     
     def ai_respond_to_envido(self, game, bet, original_better=None):
         """Determine how AI responds to an Envido bet"""
         # Get a random AI player from team 2
-        ai_players = [p for p in game.teams[1].players if not p.is_human]
+        ai_players = game.teams[1].ai_players
         if not ai_players:
             return "quiero"  # Fallback
             
@@ -1918,61 +2017,36 @@ class EnvidoBetting(BettingSystem):
         if original_better and original_better in ai_players:
             ai_player = original_better
         else:
-            ai_player = random.choice(ai_players)
-        
-        # Calculate Envido points
-        envido_points = ai_player.calculate_envido_points()
-        
-        # Adjust thresholds based on personality
-        raise_threshold = 0.1  # Default raise probability
-        accept_threshold = 0.6  # Default accept probability
-        
-        if ai_player.personality == "aggressive":
-            raise_threshold = 0.2
-            accept_threshold = 0.7
-        elif ai_player.personality == "cautious":
-            raise_threshold = 0.05
-            accept_threshold = 0.5
-        elif ai_player.personality == "bluffer":
-            raise_threshold = 0.15
-            accept_threshold = 0.65
-        
-        # Respond based on Envido points and randomness (for bluffing)
-        if bet == "Envido":
-            if envido_points > 28 or random.random() < raise_threshold:  # 10% chance to bluff and raise
-                return "raise"
-            elif envido_points > 25 or random.random() < accept_threshold:  # 60% chance to accept with decent points
-                return "quiero"
-            else:
-                return "decline"
-        elif bet == "Real Envido":
-            if envido_points > 30 or random.random() < raise_threshold/2:  # 5% chance to bluff and raise
-                return "raise"
-            elif envido_points > 27 or random.random() < accept_threshold-0.1:  # 50% chance to accept with good points
-                return "quiero"
-            else:
-                return "decline"
-        elif bet == "Falta Envido":
-            if envido_points > 31 or random.random() < accept_threshold-0.3:  # 30% chance to accept with strong points
-                return "quiero"
-            else:
-                return "decline"
-        
-        return "quiero"  # Default fallback
+            ai_player = game.rng.choice(ai_players)
+        
+        # Adjust the bluff chance based on personality
+        raise_threshold = (_ENVIDO_RAISE_BLUFFS.get(ai_player.personality) or _ENVIDO_RAISE_BLUFFS["default"])[bet]
+        
+        # Falta Envido is worth what the leading team still needs, at least 3
+        falta_points = max(3, DEFAULT_WINNING_SCORE - max(team.score for team in game.teams))
+        stake = _ENVIDO_POINTS[bet] or falta_points
+        raise_stake = None
+        if bet < EnvidoBet.FALTA_ENVIDO:
+            raise_stake = _ENVIDO_POINTS[bet + 1] or falta_points
+        
+        # Weigh the answer over sampled deals of the hidden cards
+        scores = TrucoSearch.envido_scores(game, ai_player, game.rng)
+        choice = _search_response(scores, stake, raise_stake, _ENVIDO_DECLINE_POINTS[bet], raise_threshold, game.rng)
+        return _ENVIDO_RESPONSES[choice]
     
-    def compare_envido_points(self, game, bet_type="Envido"):
+    def compare_envido_points(self, game, bet_type=EnvidoBet.ENVIDO):
         """Compare Envido points between teams and award score"""
         # Calculate points for each team
         team1_players = game.teams[0].players
         team2_players = game.teams[1].players
         
-        team1_points = max(player.calculate_envido_points() for player in team1_players)
-        team2_points = max(player.calculate_envido_points() for player in team2_players)
+        team1_points = max(player.envido_points for player in team1_players)
+        team2_points = max(player.envido_points for player in team2_players)
         
         # Display points
         self.display_manager.section("ENVIDO RESULTS", color=TerminalColors.BRIGHT_GREEN)
-        print(f"- {game.teams[0].name}: {team1_points} points")
-        print(f"- {game.teams[1].name}: {team2_points} points")
+        self.display_manager.emit(f"- {game.teams[0].name}: {team1_points} points")
+        self.display_manager.emit(f"- {game.teams[1].name}: {team2_points} points")
         
         # Determine winner and award points
         if team1_points > team2_points:
@@ -1980,88 +2054,385 @@ class EnvidoBetting(BettingSystem):
             loser = game.teams[1]
             
             # Add a celebration comment from a human player
-            human_player = next((p for p in team1_players if p.is_human), None)
+            human_player = game.teams[0].first_human
             if human_player:
-                print(f"{human_player.name}: 🗣️ My Envido is better! {team1_points}!")
+                self.display_manager.emit(f"{human_player.name}: 🗣️ My Envido is better! {team1_points}!")
                 
             # Add a losing comment from an AI player
-            ai_player = next((p for p in team2_players if not p.is_human), None)
+            ai_player = game.teams[1].first_ai
             if ai_player:
-                comment = CommentGenerator.get_comment("lose", ai_player.personality)
-                print(f"{ai_player.name}: {comment}")
+                comment = CommentGenerator.get_comment("lose", ai_player.personality, game.rng)
+                self.display_manager.emit(f"{ai_player.name}: {comment}")
                 
         elif team2_points > team1_points:
             winner = game.teams[1]
             loser = game.teams[0]
             
             # Add a celebration comment from an AI player
-            ai_player = next((p for p in team2_players if not p.is_human), None)
+            ai_player = game.teams[1].first_ai
             if ai_player:
-                comment = CommentGenerator.get_comment("win", ai_player.personality)
-                print(f"{ai_player.name}: {comment}")
+                comment = CommentGenerator.get_comment("win", ai_player.personality, game.rng)
+                self.display_manager.emit(f"{ai_player.name}: {comment}")
                 
             # Add a losing comment from a human player
-            human_player = next((p for p in team1_players if p.is_human), None)
+            human_player = game.teams[0].first_human
             if human_player:
-                print(f"{human_player.name}: 🗣️ You got me on the Envido this time...")
+                self.display_manager.emit(f"{human_player.name}: 🗣️ You got me on the Envido this time...")
                 
         else:
             # In case of a tie, the team that did not call Envido wins
             # For simplicity, we'll always give it to team 1 (player's team) in a tie
-            print("\n🤝 It's a tie! The dealer's team wins.")
+            self.display_manager.emit("\n🤝 It's a tie! The dealer's team wins.")
             winner = game.teams[0]
             loser = game.teams[1]
         
         # Award points based on bet type
-        if bet_type == "Envido":
-            points = 2
-        elif bet_type == "Real Envido":
-            points = 3
-        elif bet_type == "Falta Envido":
-            # Calculate points needed to win
-            points_to_win = DEFAULT_WINNING_SCORE - winner.score
-            points = max(3, points_to_win)  # At least 3 points
-        else:
-            points = 1  # Default
+        points = _ENVIDO_POINTS[bet_type]
+        if points is None:
+            # Falta Envido: the points needed to win, at least 3
+            points = max(3, DEFAULT_WINNING_SCORE - winner.score)
         
         winner.add_score(points)
-        print(f"\n🏆 {winner.name} wins the Envido and gets {points} point(s)!")
+        self.display_manager.emit(f"\n🏆 {winner.name} wins the Envido and gets {points} point(s)!")
         self.display_manager.show_celebration(winner.name, points, True)
         
         # Add to game history
         self.display_manager.add_to_history(f"{winner.name} won the Envido ({points} points)")
         
         # Update the game status display
-        time.sleep(SCROLL_DELAY)  # Brief pause to allow reading
+        self.display_manager.pause()  # Brief pause to allow reading
         self.display_manager.display_game_status(game)
         
         return False  # Continue the hand after Envido
 
 
+# ============== AI DECISIONS ===============
+
+# Answer names for each _search_response result
+_TRUCO_RESPONSES = ("decline", "accept", "raise")
+_ENVIDO_RESPONSES = ("decline", "quiero", "raise")
+
+
+# Plies searched before falling back to the static evaluation; a full 2-player hand is 6
+_SEARCH_DEPTH = 6
+
+# Hypothetical deals of the hidden cards averaged into each search estimate
+_SEARCH_SAMPLES = 24
+
+# Mean search score over the sampled deals at which an AI raises a bet rather than accepting it
+_RAISE_MARGIN = 0.5
+
+# Transposition table bounds: the stored score is exact, at least the true score, or at most it
+_TT_EXACT, _TT_LOWER, _TT_UPPER = 0, 1, 2
+
+# Nearer the horizon than this, a table lookup costs more than the search it saves
+_TT_MIN_DEPTH = 3
+
+
+def _hand_outcome(wins, rounds, me):
+    """Final score for team me once the hand is decided, or None while it is still open"""
+    mine, theirs = wins[me], wins[1 - me]
+    if mine >= 2:
+        return 1
+    if theirs >= 2:
+        return -1
+    if rounds == ROUNDS_PER_HAND:
+        return (mine > theirs) - (mine < theirs)
+    return None
+
+
+def _evaluate_position(hands, wins, me):
+    """Static score for a position the search stops short of: rounds won, then card strength left"""
+    mine = sum(map(sum, hands[me::2]))
+    theirs = sum(map(sum, hands[1 - me::2]))
+    score = 0.5 * (wins[me] - wins[1 - me]) + 0.5 * (mine - theirs) / ((mine + theirs) or 1)
+    return max(-1.0, min(1.0, score))
+
+
+def _alphabeta(hands, seat, leader, played, high, high_team, tied, wins, rounds, me, depth, alpha, beta, table=None):
+    """Score the position for team me with seat to move, played cards already on the table.
+    
+    Works only on tuples of integers so it stays a tight recursive kernel;
+    see TrucoSearch for the position layout. table, if given, is a
+    transposition table shared by searches with the same leader and me;
+    it maps a position to (depth, bound, score).
+    """
+    n = len(hands)
+    if played == n:
+        # Round complete: score it, then either finish the hand or start the next round
+        if not tied:
+            wins = (wins[0] + 1, wins[1]) if high_team == 0 else (wins[0], wins[1] + 1)
+        rounds += 1
+        outcome = _hand_outcome(wins, rounds, me)
+        if outcome is not None:
+            return outcome
+        seat, played, high, high_team, tied = leader, 0, -1, 0, False
+    
+    if depth == 0:
+        return _evaluate_position(hands, wins, me)
+    
+    # A position searched at least this deep before may settle the score or narrow the window
+    table_here = table if depth >= _TT_MIN_DEPTH else None
+    if table_here is not None:
+        key = (hands, seat, played, high, high_team, tied, wins, rounds)
+        entry = table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, bound, score = entry
+            if bound == _TT_EXACT:
+                return score
+            if bound == _TT_LOWER:
+                if score > alpha:
+                    alpha = score
+            elif score < beta:
+                beta = score
+            if alpha >= beta:
+                return score
+    alpha_start, beta_start = alpha, beta
+    
+    hand = hands[seat]
+    team = seat % 2
+    maximizing = team == me
+    next_seat = (seat + 1) % n
+    best = -2 if maximizing else 2
+    previous = None
+    for i, value in enumerate(hand):
+        if value == previous:
+            continue  # Equal values are the same move
+        previous = value
+        
+        child = hands[:seat] + (hand[:i] + hand[i + 1:],) + hands[seat + 1:]
+        if value > high:
+            score = _alphabeta(child, next_seat, leader, played + 1, value, team, False,
+                               wins, rounds, me, depth - 1, alpha, beta, table)
+        else:
+            score = _alphabeta(child, next_seat, leader, played + 1, high, high_team, tied or value == high,
+                               wins, rounds, me, depth - 1, alpha, beta, table)
+        
+        if maximizing:
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+        else:
+            if score < best:
+                best = score
+            if best < beta:
+                beta = best
+        if alpha >= beta:
+            break  # The other side will never allow this line
+    
+    if table_here is not None:
+        # A score outside the starting window is only a bound on the true score
+        if best <= alpha_start:
+            bound = _TT_UPPER
+        elif best >= beta_start:
+            bound = _TT_LOWER
+        else:
+            bound = _TT_EXACT
+        table[key] = (depth, bound, best)
+    return best
+
+
+class TrucoSearch:
+    """Depth-limited alpha-beta over the card play left in a hand.
+    
+    A position is a tuple of hands (Truco values, highest first), one per
+    seat. Seats alternate teams, with even seats on team 0. The same seat
+    leads every round, and an equal top card ties the round, exactly as
+    TrucoGame plays it. Scores are from team `me`'s side: 1 for a won
+    hand, -1 for a lost one and 0 for a drawn one.
+    """
+    
+    # The search kernel itself is the module-level _alphabeta
+    alphabeta = staticmethod(_alphabeta)
+    
+    @staticmethod
+    def sample_determinizations(game, player, rng=_RNG, samples=_SEARCH_SAMPLES):
+        """Random deals of the cards player cannot see: one tuple of hands (by seat) per sample.
+        
+        Player's own seat keeps its real cards; only player's hand and the
+        cards already played this hand are known. Deals are cached on the
+        game until the next card is played, so every decision a player makes
+        on one turn, Envido or Truco, reuses them.
+        """
+        key = (player, len(game.played_cards))
+        deals = game.determinizations.get(key)
+        if deals is not None:
+            return deals
+        
+        seats = game.players[:game.num_players]
+        known = set(player.hand)
+        known.update(game.played_cards)
+        unseen = [card for card in _PROTOTYPE_DECK if card not in known]
+        own_hand = tuple(player.hand)
+        sizes = [len(p.hand) for p in seats]
+        hidden = sum(sizes) - len(own_hand)
+        
+        deals = []
+        for _ in range(samples):
+            deal = rng.sample(unseen, hidden)
+            hands = []
+            start = 0
+            for seat_player, size in zip(seats, sizes):
+                if seat_player is player:
+                    hands.append(own_hand)
+                else:
+                    hands.append(tuple(deal[start:start + size]))
+                    start += size
+            deals.append(tuple(hands))
+        
+        game.determinizations[key] = deals
+        return deals
+    
+    @staticmethod
+    def _round_state(game):
+        """The round in progress as (high, high_team, tied, wins, rounds) for _alphabeta"""
+        seats = game.players[:game.num_players]
+        high, high_team, tied = -1, 0, False
+        for seat_player, card in game.round_cards:
+            if card.value > high:
+                high, high_team, tied = card.value, seats.index(seat_player) % 2, False
+            elif card.value == high:
+                tied = True
+        team_wins = Counter(winner.team for winner in game.round_winners)
+        wins = (team_wins[game.teams[0]], team_wins[game.teams[1]])
+        rounds = max(game.current_round - 1, 0)
+        return high, high_team, tied, wins, rounds
+    
+    @staticmethod
+    def _value_hands(deal):
+        """A determinization as the search sees it: each hand's Truco values, highest first"""
+        return tuple(tuple(sorted((card.value for card in hand), reverse=True)) for hand in deal)
+    
+    @staticmethod
+    def truco_scores(game, player, rng=_RNG):
+        """Search the rest of the hand once per determinization; one score per deal"""
+        me = game.players[:game.num_players].index(player) % 2
+        leader = (game.hand_number - 1) % game.num_players
+        high, high_team, tied, wins, rounds = TrucoSearch._round_state(game)
+        
+        # Deals differ only in hidden cards, so their searches keep running into the same positions
+        table = {}
+        scores = []
+        for deal in TrucoSearch.sample_determinizations(game, player, rng):
+            hands = TrucoSearch._value_hands(deal)
+            scores.append(_alphabeta(hands, game.current_player_index, leader, len(game.round_cards),
+                                     high, high_team, tied, wins, rounds, me, _SEARCH_DEPTH, -2, 2, table))
+        return scores
+    
+    @staticmethod
+    def choose_card(game, player, rng=_RNG):
+        """Index of the card in player's hand that scores best over the determinizations.
+        
+        Each distinct card value is tried as player's move and the rest of
+        the hand searched in every deal; the best total wins, and among
+        equals the lowest card, keeping stronger ones for later rounds.
+        """
+        seat = game.current_player_index
+        me = seat % 2
+        leader = (game.hand_number - 1) % game.num_players
+        high, high_team, tied, wins, rounds = TrucoSearch._round_state(game)
+        played = len(game.round_cards) + 1
+        next_seat = (seat + 1) % game.num_players
+        deals = [TrucoSearch._value_hands(deal) for deal in TrucoSearch.sample_determinizations(game, player, rng)]
+        
+        table = {}
+        best_value, best_total = None, None
+        for value in sorted(set(player.hand_values)):
+            if value > high:
+                after = (value, me, False)
+            else:
+                after = (high, high_team, tied or value == high)
+            total = 0
+            for hands in deals:
+                own = list(hands[seat])
+                own.remove(value)
+                hands = hands[:seat] + (tuple(own),) + hands[seat + 1:]
+                total += _alphabeta(hands, next_seat, leader, played, *after, wins, rounds, me,
+                                    _SEARCH_DEPTH - 1, -2, 2, table)
+            if best_total is None or total > best_total:
+                best_value, best_total = value, total
+        return player.hand_values.index(best_value)
+    
+    @staticmethod
+    def envido_scores(game, player, rng=_RNG):
+        """Envido showdown for player's team in each determinization: 1 won, -1 lost"""
+        me = game.players[:game.num_players].index(player) % 2
+        scores = []
+        for deal in TrucoSearch.sample_determinizations(game, player, rng):
+            best = [0, 0]
+            for seat, hand in enumerate(deal):
+                points = _envido_points(hand)
+                if points > best[seat % 2]:
+                    best[seat % 2] = points
+            # A tie goes to team 0, as in EnvidoBetting.compare_envido_points
+            won = best[me] > best[1 - me] or (best[me] == best[1 - me] and me == 0)
+            scores.append(1 if won else -1)
+        return scores
+    
+    @staticmethod
+    def estimate(game, player, rng=_RNG):
+        """Expected hand result for player's team, from -1 (sure loss) to 1 (sure win)"""
+        scores = TrucoSearch.truco_scores(game, player, rng)
+        return sum(scores) / len(scores)
+
+
+def _search_response(scores, stake, raise_stake, fold, raise_threshold, rng=_RNG):
+    """Answer a bet from the search scores of the sampled deals: 0 to decline, 1 to accept or 2 to raise.
+    
+    Accepting is worth the mean score times the stake; declining concedes
+    fold points. Only a clearly winning outlook (_RAISE_MARGIN) raises.
+    raise_stake is None when the bet cannot be raised. If the answer is to
+    decline, raise_threshold is the personality's _coin threshold to bluff
+    a raise instead.
+    """
+    outlook = sum(scores) / len(scores)
+    if raise_stake is not None and outlook >= _RAISE_MARGIN:
+        return 2
+    if outlook * stake >= -fold:
+        return 1
+    if raise_stake is not None and _coin(raise_threshold, rng):
+        return 2
+    return 0
+
+
 # ============== MAIN GAME CLASS ===============
 
+# Personalities handed out to AI players at setup
+_AI_PERSONALITIES = ("aggressive", "cautious", "bluffer", "normal")
+
+
 class TrucoGame:
-    def __init__(self, num_players=2, envido_enabled=True, advisor_enabled=True):
+    def __init__(self, num_players=2, envido_enabled=True, advisor_enabled=True, quiet=False, interactive=True, seed=None):
         self.num_players = num_players
         if num_players not in [2, 4, 6]:
             raise ValueError("Truco must be played with 2, 4, or 6 players")
             
         self.players = []
         self.teams = []
-        self.deck = None
+        self.human_player = None
+        self._card_pool = list(_PROTOTYPE_DECK)  # Partially reshuffled each hand
         self.current_player_index = 0
         self.current_round = 0
         self.hand_number = 0
         self.envido_phase = True
         self.envido_enabled = envido_enabled
         self.advisor_enabled = advisor_enabled
-        self.current_bet = "No bet"
+        self.quiet = quiet  # No output or pauses, for fast AI simulations
+        self.interactive = interactive  # False never waits for Enter, for unattended runs
+        self.current_bet = BetState.NONE
         self.bet_value = 1
+        self.ai_bet_chance = _P30  # Odds (out of 65536) an AI weighs betting on its turn; 0 turns it off
         self.round_cards = []  # [(player, card), ...]
         self.round_winners = []  # [player, player, ...]
+        self.played_cards = []  # Every card played this hand, which everyone at the table has seen
+        self.determinizations = {}  # (player, cards played) -> sampled deals, see TrucoSearch
+        
+        # Every random draw in a game comes from its own generator; pass seed to replay a game
+        self.rng = random.Random(seed)
         
         # Initialize display manager
-        self.display_manager = DisplayManager()
+        self.display_manager = DisplayManager(quiet=quiet, rng=self.rng, interactive=interactive)
         
         # Initialize betting systems
         self.truco_betting = TrucoBetting(self.display_manager)
@@ -2080,6 +2451,8 @@ class TrucoGame:
         # Create human player
         human_player = Player(player_name, is_human=True)
         self.players.append(human_player)
+        # Setup can run more than once, so cache the first human seated
+        self.human_player = next(p for p in self.players if p.is_human)
         
         # If AI names weren't provided, use defaults
         if not ai_names:
@@ -2090,9 +2463,8 @@ class TrucoGame:
                 ai_names.append(f"AI Player {len(ai_names) + 1}")
         
         # Create AI players with different personalities
-        personalities = ["aggressive", "cautious", "bluffer", "normal"]
         for i in range(1, self.num_players):
-            personality = random.choice(personalities)
+            personality = self.rng.choice(_AI_PERSONALITIES)
             ai_player = Player(ai_names[i-1], is_human=False, personality=personality)
             self.players.append(ai_player)
         
@@ -2109,8 +2481,8 @@ class TrucoGame:
         
         # Display team information
         self.display_manager.section("TEAM SETUP", end_separator=False)
-        print(f"- {self.teams[0].name}: {self.teams[0].get_player_names()}")
-        print(f"- {self.teams[1].name}: {self.teams[1].get_player_names()}")
+        self.display_manager.emit(f"- {self.teams[0].name}: {self.teams[0].get_player_names()}")
+        self.display_manager.emit(f"- {self.teams[1].name}: {self.teams[1].get_player_names()}")
         
         # Show AI personalities
         self.display_manager.section("AI PLAYER PERSONALITIES", end_separator=False)
@@ -2122,7 +2494,7 @@ class TrucoGame:
                     "bluffer": "😏", 
                     "normal": "😐"
                 }.get(player.personality, "😐")
-                print(f"- {player.name}: {personality_emoji} {player.personality.capitalize()}")
+                self.display_manager.emit(f"- {player.name}: {personality_emoji} {player.personality.capitalize()}")
         
         # Show tutorial information based on level
         if tutorial_level in ["full", "basic", "minimal"]:
@@ -2138,33 +2510,35 @@ class TrucoGame:
         # Show advisor information if enabled
         if self.advisor_enabled:
             self.display_manager.show_big_message("CARD VALUE ADVISOR ENABLED", "💡")
-            print("\nThe Card Value Advisor is here to help you learn Truco!")
-            print("During your turn, you can use these commands:")
-            print("- Type 'help' for a quick reference guide")
-            print("- Type 'advisor' for advice on which card to play")
-            print("- Type 'values' to see detailed information about your cards")
-            print("- Type 'ranking' to see the full card ranking chart")
-            print("\nYou can also get specific advice during betting phases.")
+            self.display_manager.emit("\nThe Card Value Advisor is here to help you learn Truco!")
+            self.display_manager.emit("During your turn, you can use these commands:")
+            self.display_manager.emit("- Type 'help' for a quick reference guide")
+            self.display_manager.emit("- Type 'advisor' for advice on which card to play")
+            self.display_manager.emit("- Type 'values' to see detailed information about your cards")
+            self.display_manager.emit("- Type 'ranking' to see the full card ranking chart")
+            self.display_manager.emit("\nYou can also get specific advice during betting phases.")
             self.display_manager.press_any_key()
         
     def deal_cards(self):
         """Deal cards to all players for a new hand"""
-        self.deck = Deck()
-        self.deck.shuffle()
+        # Only the dealt cards need shuffling; the pool is reused across hands
+        pool = self._card_pool
+        _partial_shuffle(pool, CARDS_PER_PLAYER * self.num_players, self.rng)
         
         # Each player gets 3 cards
-        for player in self.players:
-            player.hand = []
-            cards = self.deck.deal(CARDS_PER_PLAYER)
-            player.add_cards(cards)
+        for i, player in enumerate(self.players):
+            player.clear_hand()
+            player.add_cards(pool[i * CARDS_PER_PLAYER:(i + 1) * CARDS_PER_PLAYER])
         
         self.hand_number += 1
         self.current_round = 0
         self.envido_phase = True
-        self.current_bet = "No bet"
+        self.current_bet = BetState.NONE
         self.bet_value = 1
         self.round_cards = []
         self.round_winners = []
+        self.played_cards = []
+        self.determinizations = {}
         
         # Determine who plays first (rotates each hand)
         self.current_player_index = (self.hand_number - 1) % self.num_players
@@ -2174,47 +2548,32 @@ class TrucoGame:
         self.display_manager.show_big_message(f"NEW HAND #{self.hand_number}", "🎮")
         
         # Display the human player's hand at the start of a new hand
-        human_player = next((p for p in self.players if p.is_human), None)
+        human_player = self.human_player
         if human_player:
             self.display_manager.display_hand(human_player)
                 
             # If advisor is enabled, provide hand analysis
             if self.advisor_enabled:
-                print("\n" + CardAdvisor.analyze_hand(human_player.hand, self.display_manager))
+                self.display_manager.emit("\n" + CardAdvisor.analyze_hand(human_player.hand, self.display_manager))
             
             # Add a random comment from an AI player at the start of a new hand
-            ai_player = next((p for p in self.players if not p.is_human), None)
-            if ai_player and random.random() < 0.7:  # 70% chance for a comment
+            ai_player = self.teams[1].first_ai
+            if ai_player and _coin(_P70, self.rng):  # 70% chance for a comment
                 # Different comments based on the score situation
                 if self.teams[0].score > self.teams[1].score:
-                    comments = [
-                        "Time to catch up!",
-                        "You won't be ahead for long!",
-                        "Let's see if your luck continues...",
-                        "Don't get too confident!",
-                    ]
+                    comments = CommentGenerator.HAND_START_TRAILING
                 elif self.teams[0].score < self.teams[1].score:
-                    comments = [
-                        "I'm feeling good about this hand!",
-                        "We're on a roll now!",
-                        "Try to keep up, will you?",
-                        "This game is ours!",
-                    ]
+                    comments = CommentGenerator.HAND_START_LEADING
                 else:  # Tied score
-                    comments = [
-                        "Time to break this tie!",
-                        "Let's see who takes the lead!",
-                        "May the best team win!",
-                        "This hand will be decisive!",
-                    ]
+                    comments = CommentGenerator.HAND_START_TIED
                 
-                print(f"\n{ai_player.name}: 🗣️ {random.choice(comments)}")
+                self.display_manager.emit(f"\n{ai_player.name}: 🗣️ {self.rng.choice(comments)}")
         
     def play_game(self):
         """Main game loop"""
         self.setup_game()
         
-        while not any(team.has_won_game() for team in self.teams):
+        while self.get_game_winner() is None:
             self.deal_cards()
             # Wait for player to be ready to start the hand
             self.display_manager.press_any_key("Press Enter to start playing this hand...")
@@ -2229,36 +2588,29 @@ class TrucoGame:
             self.play_hand()
             
             # Check if any team has won
-            if any(team.has_won_game() for team in self.teams):
-                # Find the winning team
-                winning_team = next(team for team in self.teams if team.has_won_game())
+            winning_team = self.get_game_winner()
+            if winning_team is not None:
                 self.display_manager.show_big_message("GAME OVER", "🎉")
                 
                 # Format the winning message
                 win_msg = f"{winning_team.name} wins the game with {winning_team.score} points!"
                 if ENABLE_COLORS:
                     win_msg = TerminalColors.colorize(win_msg, TerminalColors.BRIGHT_GREEN, bold=True)
-                print(f"\n🏆 {win_msg}")
+                self.display_manager.emit(f"\n🏆 {win_msg}")
                 
                 # Show final score
                 self.display_manager.display_score(self.teams)
                 
                 # Add celebration comment from winning team
                 if winning_team == self.teams[0]:
-                    human_player = next((p for p in self.teams[0].players if p.is_human), None)
+                    human_player = self.teams[0].first_human
                     if human_player:
-                        print(f"\n{human_player.name}: 🗣️ What a game! We did it!")
+                        self.display_manager.emit(f"\n{human_player.name}: 🗣️ What a game! We did it!")
                 else:
-                    ai_player = next((p for p in self.teams[1].players if not p.is_human), None)
+                    ai_player = self.teams[1].first_ai
                     if ai_player:
-                        comments = [
-                            "Better luck next time!",
-                            "That was a good game! Thanks for playing!",
-                            "We make a great team!",
-                            "That's how it's done in Argentina!",
-                            "Victory is sweet!",
-                        ]
-                        print(f"\n{ai_player.name}: 🗣️ {random.choice(comments)}")
+                        comments = CommentGenerator.GAME_WIN_AI
+                        self.display_manager.emit(f"\n{ai_player.name}: 🗣️ {self.rng.choice(comments)}")
                 break
                 
             self.display_manager.press_any_key("Press Enter to continue to the next hand...")
@@ -2280,7 +2632,7 @@ class TrucoGame:
             self.display_manager.show_big_message(f"ROUND {self.current_round}", "🎯")
             
             # Always display human player's hand at the beginning of each round
-            human_player = next((p for p in self.players if p.is_human), None)
+            human_player = self.human_player
             if human_player:
                 self.display_manager.display_hand(human_player)
                 
@@ -2288,7 +2640,7 @@ class TrucoGame:
                 if self.advisor_enabled and human_player.hand:
                     is_first_player = len(self.round_cards) == 0
                     advice = CardAdvisor.get_play_advice(human_player.hand, self.round_cards, is_first_player, self.display_manager)
-                    print(f"\n{advice}")
+                    self.display_manager.emit(f"\n{advice}")
             
             # Each player plays one card
             for _ in range(self.num_players):
@@ -2323,21 +2675,15 @@ class TrucoGame:
                 
                 # Add celebration comments from winning team
                 if winning_team == self.teams[0]:
-                    human_player = next((p for p in self.teams[0].players if p.is_human), None)
+                    human_player = self.teams[0].first_human
                     if human_player:
-                        celebration_comments = [
-                            "That's how it's done!",
-                            "Great hand, team!",
-                            "We played that perfectly!",
-                            "That's what I'm talking about!",
-                            "Let's keep this momentum going!",
-                        ]
-                        print(f"\n{human_player.name}: 🗣️ {random.choice(celebration_comments)}")
+                        celebration_comments = CommentGenerator.HAND_WIN_HUMAN
+                        self.display_manager.emit(f"\n{human_player.name}: 🗣️ {self.rng.choice(celebration_comments)}")
                 else:
-                    ai_player = next((p for p in self.teams[1].players if not p.is_human), None)
+                    ai_player = self.teams[1].first_ai
                     if ai_player:
-                        comment = CommentGenerator.get_comment("win", ai_player.personality)
-                        print(f"\n{ai_player.name}: {comment}")
+                        comment = CommentGenerator.get_comment("win", ai_player.personality, self.rng)
+                        self.display_manager.emit(f"\n{ai_player.name}: {comment}")
                 
                 self.display_manager.show_celebration(winning_team.name, self.bet_value, True)
                 self.display_manager.add_to_history(f"{winning_team.name} won the hand ({self.bet_value} points)")
@@ -2346,13 +2692,14 @@ class TrucoGame:
         # After all rounds are played or a team has won early, determine the final result
         if self.current_round == ROUNDS_PER_HAND and not self.get_winning_team():
             # Handle tie situations
-            team1_wins = sum(1 for winner in self.round_winners if winner in self.teams[0].players)
-            team2_wins = sum(1 for winner in self.round_winners if winner in self.teams[1].players)
+            team_wins = Counter(winner.team for winner in self.round_winners)
+            team1_wins = team_wins[self.teams[0]]
+            team2_wins = team_wins[self.teams[1]]
             
             if team1_wins == team2_wins:
                 # It's a complete tie, no points awarded
                 self.display_manager.show_tie_message()
-                print("\nThe hand ends in a tie! No points awarded.")
+                self.display_manager.emit("\nThe hand ends in a tie! No points awarded.")
                 self.display_manager.add_to_history("Hand ended in a complete tie")
             elif team1_wins > team2_wins:
                 # Team 1 won more rounds (1-0-2 or 2-1-0)
@@ -2370,19 +2717,19 @@ class TrucoGame:
         A team needs to win at least 2 rounds to win the hand"""
         
         # Count how many times each team won
-        team_wins = {team: 0 for team in self.teams}
-        
-        for winner in self.round_winners:
-            for team in self.teams:
-                if winner in team.players:
-                    team_wins[team] += 1
+        team_wins = Counter(winner.team for winner in self.round_winners)
+        if not team_wins:
+            return None
         
         # A team needs to win at least 2 rounds to win the hand
-        for team, wins in team_wins.items():
-            if wins >= 2:
+        team, wins = team_wins.most_common(1)[0]
+        return team if wins >= 2 else None
+    
+    def get_game_winner(self):
+        """Return the first team to reach the winning score, or None while the game is still on"""
+        for team in self.teams:
+            if team.has_won_game():
                 return team
-                
-        # No team has won 2 rounds yet
         return None
 
     def human_turn(self):
@@ -2390,7 +2737,7 @@ class TrucoGame:
         player = self.players[self.current_player_index]
         
         # First check for betting options, but always ensure hand is displayed
-        if self.current_bet == "No bet" and len(player.hand) > 0:
+        if self.current_bet == BetState.NONE and len(player.hand) > 0:
             # Make sure the current game status is clear and up-to-date before betting
             self.display_manager.display_game_status(self)
             
@@ -2411,12 +2758,12 @@ class TrucoGame:
         
         # If advisor is enabled, provide a hint
         if self.advisor_enabled:
-            print("\nType 'help' for commands, 'advisor' for play advice, or a number to play a card.")
+            self.display_manager.emit("\nType 'help' for commands, 'advisor' for play advice, or a number to play a card.")
         
         valid_choice = False
         while not valid_choice:
             try:
-                choice = input("\n🤔 Which card do you want to play? (Enter the number or command): ").strip()
+                choice = InputUtils.read_line("\n🤔 Which card do you want to play? (Enter the number or command): ")
                 
                 # Check for help commands
                 if choice.lower() in ['help', 'h', '?']:
@@ -2431,16 +2778,16 @@ class TrucoGame:
                     continue
                 elif choice.lower() == 'advisor':
                     advice = CardAdvisor.get_play_advice(player.hand, self.round_cards, len(self.round_cards) == 0, self.display_manager)
-                    print(advice)
+                    self.display_manager.emit(advice)
                     continue
                 elif choice.lower() == 'values':
                     # Display detailed card information
                     self.display_manager.section("DETAILED CARD VALUES", color=TerminalColors.BRIGHT_MAGENTA)
                     for card in player.hand:
-                        print(f"\n{card.get_detailed_description()}")
+                        self.display_manager.emit(f"\n{card.get_detailed_description()}")
                     continue
                 elif choice.lower() == 'ranking':
-                    print(Deck.get_card_cheat_sheet())
+                    self.display_manager.emit(Deck.get_card_cheat_sheet())
                     continue
                 elif not choice:  # Skip empty input
                     continue
@@ -2449,7 +2796,7 @@ class TrucoGame:
                 
                 if 0 <= card_index < len(player.hand):
                     card = player.play_card(card_index)
-                    self.round_cards.append((player, card))
+                    self.add_round_card(player, card)
                     
                     # Display the played card
                     self.display_manager.section("CARD PLAYED", color=TerminalColors.BRIGHT_BLUE)
@@ -2459,38 +2806,23 @@ class TrucoGame:
                     self.display_manager.add_to_history(f"{player.name} played {card.get_display()}")
                     
                     # Add a verbal comment that matches the card's strength
-                    is_strong = False
-                    if card.value >= 10 or card.rank in ['1', '2', '3']:  # Top cards and strong number cards
-                        is_strong = True
-                        
-                    if is_strong:
-                        comments = [
-                            "Take that!",
-                            "Beat this if you can!",
-                            "How's this for a card?",
-                            "Watch and learn!",
-                            "This should do the trick!",
-                        ]
-                        print(f"{player.name}: 🗣️ {random.choice(comments)}")
-                    elif random.random() < 0.4:  # 40% chance to bluff with a weak card
-                        comments = [
-                            "I've got this round secured!",
-                            "Let's see you top that!",
-                            "I'm feeling good about this play!",
-                            "The best card at the perfect time!",
-                        ]
-                        print(f"{player.name}: 🗣️ {random.choice(comments)}")
+                    if card.is_strong:
+                        comments = CommentGenerator.PLAY_STRONG_CARD_HUMAN
+                        self.display_manager.emit(f"{player.name}: 🗣️ {self.rng.choice(comments)}")
+                    elif _coin(_P40, self.rng):  # 40% chance to bluff with a weak card
+                        comments = CommentGenerator.PLAY_BLUFF_CARD_HUMAN
+                        self.display_manager.emit(f"{player.name}: 🗣️ {self.rng.choice(comments)}")
                     
                     valid_choice = True
                 else:
-                    print("❌ Invalid card number. Please try again.")
+                    self.display_manager.emit("❌ Invalid card number. Please try again.")
             except ValueError:
                 if choice.strip() and not choice.lower() in ['help', 'h', '?', 'advisor', 'values', 'ranking']:
                     # Only show error for non-empty, non-command input
-                    print("❌ Please enter a valid number or command.")
+                    self.display_manager.emit("❌ Please enter a valid number or command.")
         
         # Add a small delay for readability
-        time.sleep(SCROLL_DELAY)
+        self.display_manager.pause()
         return False
 
     def ai_turn(self):
@@ -2500,7 +2832,7 @@ class TrucoGame:
         self.display_manager.section(f"{player.name}'s TURN", color=TerminalColors.BRIGHT_BLUE)
         
         # Always display human player's hand before AI makes a move
-        human_player = next((p for p in self.players if p.is_human), None)
+        human_player = self.human_player
         if human_player and human_player != player and human_player.hand:
             self.display_manager.display_hand(human_player)
             
@@ -2510,34 +2842,20 @@ class TrucoGame:
         
         # Simple AI strategy
         # If it's the betting phase, sometimes make a bet
-        if self.current_bet == "No bet" and random.random() < 0.3:
+        if self.current_bet == BetState.NONE and self.ai_bet_chance and _coin(self.ai_bet_chance, self.rng):
             end_hand = self.truco_betting.handle_ai_truco_betting(self, player)
             if end_hand:
                 return True
         
-        # Choose a card (simple strategy)
+        # Choose a card
         if not player.hand:
             return False  # No cards to play
             
-        # Determine if AI should play a strong or weak card
-        if len(self.round_cards) == 0:
-            # AI plays first in the round, choose randomly
-            card_index = random.randint(0, len(player.hand) - 1)
-        else:
-            # Check the highest card played so far
-            highest_card = max((card for _, card in self.round_cards), key=lambda x: x.value)
-            
-            # Find cards that can beat the highest card
-            better_cards = [i for i, card in enumerate(player.hand) if card.value > highest_card.value]
-            
-            if better_cards and random.random() < 0.7:  # 70% chance to play a winning card if available
-                card_index = random.choice(better_cards)
-            else:
-                # Play the weakest card
-                card_index = min(range(len(player.hand)), key=lambda i: player.hand[i].value)
+        # Search the rest of the hand for the card that does best against the likely deals
+        card_index = TrucoSearch.choose_card(self, player, self.rng)
         
         card = player.play_card(card_index)
-        self.round_cards.append((player, card))
+        self.add_round_card(player, card)
         
         # Display the played card
         self.display_manager.display_card_played(player, card)
@@ -2546,18 +2864,24 @@ class TrucoGame:
         self.display_manager.add_to_history(f"{player.name} played {card.get_display()}")
         
         # Add a verbal comment based on the card played and personality
-        comment = CommentGenerator.get_comment("play_strong_card" if card.value >= 8 else "play_weak_card", player.personality)
-        print(f"{player.name}: {comment}")
+        comment = CommentGenerator.get_comment("play_strong_card" if card.value >= 8 else "play_weak_card", player.personality, self.rng)
+        comment_lines = [f"{player.name}: {comment}"]
         
         # Add occasional random bluffing comment
-        if player.personality == "bluffer" and random.random() < 0.3:
-            bluff_comment = CommentGenerator.get_comment("bluff", player.personality)
-            print(f"{player.name}: {bluff_comment}")
+        if player.personality == "bluffer" and _coin(_P30, self.rng):
+            bluff_comment = CommentGenerator.get_comment("bluff", player.personality, self.rng)
+            comment_lines.append(f"{player.name}: {bluff_comment}")
+        self.display_manager.emit(*comment_lines)
         
         # Add a small delay for readability
-        time.sleep(SCROLL_DELAY)
+        self.display_manager.pause()
         return False
     
+    def add_round_card(self, player, card):
+        """Put a played card on the table and record it as seen for the rest of the hand"""
+        self.round_cards.append((player, card))
+        self.played_cards.append(card)
+    
     def determine_round_winner(self):
         """Determine the winner of the current round"""
         if not self.round_cards:
@@ -2567,35 +2891,37 @@ class TrucoGame:
         self.display_manager.section("ROUND RESULT", color=TerminalColors.BRIGHT_YELLOW)
         self.display_manager.display_played_cards(self.round_cards)
             
-        # Find the highest card
+        # Find the highest card in one pass; a tie for the top means nobody wins the round
         highest_card_value = -1
-        highest_players = []
-        
-        for player, card in self.round_cards:
-            if card.value > highest_card_value:
-                highest_card_value = card.value
-                highest_players = [player]
-            elif card.value == highest_card_value:
-                highest_players.append(player)
+        best_index = -1
+        tied = False
+        
+        for i, (_, card) in enumerate(self.round_cards):
+            value = card.value
+            if value > highest_card_value:
+                highest_card_value = value
+                best_index = i
+                tied = False
+            elif value == highest_card_value:
+                tied = True
         
         # If there's a single winner
-        if len(highest_players) == 1:
-            winner = highest_players[0]
+        if not tied:
+            winner, winning_card = self.round_cards[best_index]
             self.round_winners.append(winner)
             
             # Determine which team won
-            winning_team = self.teams[0] if winner in self.teams[0].players else self.teams[1]
-            
-            winning_card = next(card for p, card in self.round_cards if p == winner)
+            winning_team = winner.team
             
             # Format the winner announcement
             winner_msg = f"{winner.name} wins round {self.current_round} for {winning_team.name}!"
             if ENABLE_COLORS:
                 winner_msg = TerminalColors.colorize(winner_msg, TerminalColors.BRIGHT_GREEN, bold=True)
-            print(f"\n🏆 {winner_msg}")
-            
-            # Show the winning card
-            print(f"🃏 Winning card: {self.display_manager.format_card(winning_card)}")
+            # Announce the winner and the winning card together
+            self.display_manager.emit(
+                f"\n🏆 {winner_msg}",
+                f"🃏 Winning card: {self.display_manager.format_card(winning_card)}",
+            )
             
             # Add to game history
             self.display_manager.add_to_history(f"{winner.name} won round {self.current_round}")
@@ -2603,41 +2929,33 @@ class TrucoGame:
             # Highlight why this card won (for educational purposes)
             if self.advisor_enabled:
                 self.display_manager.section("LEARNING POINT", color=TerminalColors.BRIGHT_CYAN)
-                print(f"{winning_card.get_display()} won because:")
-                print(f"- Card value: {winning_card.value}/14 (higher is better)")
-                print(f"- {winning_card.get_detailed_description()}")
+                self.display_manager.emit(
+                    f"{winning_card.get_display()} won because:",
+                    f"- Card value: {winning_card.value}/14 (higher is better)",
+                    f"- {winning_card.get_detailed_description()}",
+                )
             
             # Add victory/defeat comments
             if winner.is_human:
                 # Human player wins
-                comments = [
-                    "Got it!",
-                    "That's how it's done!",
-                    "Perfect timing!",
-                    "Just as I planned!",
-                ]
-                print(f"{winner.name}: 🗣️ {random.choice(comments)}")
+                comments = CommentGenerator.ROUND_WIN_HUMAN
+                self.display_manager.emit(f"{winner.name}: 🗣️ {self.rng.choice(comments)}")
                 
                 # AI player loses
                 losing_player = next((p for p, _ in self.round_cards if p != winner and not p.is_human), None)
                 if losing_player:
-                    comment = CommentGenerator.get_comment("lose", losing_player.personality)
-                    print(f"{losing_player.name}: {comment}")
+                    comment = CommentGenerator.get_comment("lose", losing_player.personality, self.rng)
+                    self.display_manager.emit(f"{losing_player.name}: {comment}")
             else:
                 # AI player wins
-                comment = CommentGenerator.get_comment("win", winner.personality)
-                print(f"{winner.name}: {comment}")
+                comment = CommentGenerator.get_comment("win", winner.personality, self.rng)
+                self.display_manager.emit(f"{winner.name}: {comment}")
                 
                 # Human player loses
                 losing_player = next((p for p, _ in self.round_cards if p != winner and p.is_human), None)
                 if losing_player:
-                    comments = [
-                        "Nice play.",
-                        "You got me there.",
-                        "I'll get you in the next round.",
-                        "Well played.",
-                    ]
-                    print(f"{losing_player.name}: 🗣️ {random.choice(comments)}")
+                    comments = CommentGenerator.ROUND_LOSS_HUMAN
+                    self.display_manager.emit(f"{losing_player.name}: 🗣️ {self.rng.choice(comments)}")
             
             # Show celebration message
             self.display_manager.show_celebration(winning_team.name, 0, False)
@@ -2648,19 +2966,33 @@ class TrucoGame:
         self.display_manager.display_round_status(self.current_round, self.round_winners, self.teams)
             
         # Always show human player's hand after the round
-        human_player = next((p for p in self.players if p.is_human), None)
+        human_player = self.human_player
         if human_player and human_player.hand:
-            print("\n🃏 Your remaining hand:")
+            self.display_manager.emit("\n🃏 Your remaining hand:")
             self.display_manager.display_hand(human_player)
                 
             # If advisor is enabled and this isn't the last round, provide advice
             if self.advisor_enabled and self.current_round < ROUNDS_PER_HAND and len(human_player.hand) > 0:
                 advice = CardAdvisor.analyze_hand(human_player.hand, self.display_manager)
-                print(f"\n{advice}")
+                self.display_manager.emit(f"\n{advice}")
 
 
 # ============== MAIN FUNCTION ===============
 
+_PLAYER_COUNT_MENU = "\n".join([
+    "Select number of players:",
+    "1. 👤 vs 🤖 (2 players, 1 vs 1)",
+    "2. 👥 vs 🤖🤖 (4 players, 2 vs 2)",
+    "3. 👥👥 vs 🤖🤖🤖 (6 players, 3 vs 3)",
+])
+
+_TUTORIAL_LEVEL_MENU = "\n".join([
+    "\n📚 Choose tutorial level:",
+    "1. Full - Complete explanation of rules, card values, and strategy",
+    "2. Basic - Quick overview of essential rules and card values",
+    "3. Minimal - Just the card ranking, for experienced players",
+])
+
 def main():
     """Main function to start the game"""
     display_manager = DisplayManager()
@@ -2680,57 +3012,26 @@ def main():
     # Choose number of players
     display_manager.section("GAME SETUP", color=TerminalColors.BRIGHT_CYAN)
     
-    print("Select number of players:")
-    print("1. 👤 vs 🤖 (2 players, 1 vs 1)")
-    print("2. 👥 vs 🤖🤖 (4 players, 2 vs 2)")
-    print("3. 👥👥 vs 🤖🤖🤖 (6 players, 3 vs 3)")
+    print(_PLAYER_COUNT_MENU)
     
-    num_players = 2  # Default
-    while True:
-        try:
-            choice = input("\n🔢 Enter your choice (1-3): ").strip()
-            if not choice:
-                break  # Use default
-            choice = int(choice)
-            if 1 <= choice <= 3:
-                num_players = choice * 2
-                break
-            else:
-                print("❌ Invalid choice. Please try again.")
-        except ValueError:
-            print("❌ Please enter a valid number.")
+    num_players = InputUtils.prompt_int("\n🔢 Enter your choice (1-3): ", 1, 3, 1, display_manager) * 2  # Default: 2 players
     
     # Enable Envido?
     print("\n🎮 Envido is a betting feature at the start of each hand.")
-    enable_envido = input("Enable Envido? (y/n, default: y): ").lower() != 'n'
+    enable_envido = InputUtils.read_line("Enable Envido? (y/n, default: y): ").lower() != 'n'
     
     # Enable Card Advisor?
     print("\n💡 The Card Value Advisor helps you learn the game by providing tips and strategic advice.")
-    enable_advisor = input("Enable Card Value Advisor? (y/n, default: y): ").lower() != 'n'
+    enable_advisor = InputUtils.read_line("Enable Card Value Advisor? (y/n, default: y): ").lower() != 'n'
     
     # Choose tutorial level
-    print("\n📚 Choose tutorial level:")
-    print("1. Full - Complete explanation of rules, card values, and strategy")
-    print("2. Basic - Quick overview of essential rules and card values")
-    print("3. Minimal - Just the card ranking, for experienced players")
+    print(_TUTORIAL_LEVEL_MENU)
     
-    tutorial_level = "full"  # Default
-    while True:
-        try:
-            level_choice = input("\n🔢 Enter your choice (1-3, default: 1): ").strip()
-            if not level_choice:
-                break  # Use default
-            level_choice = int(level_choice)
-            if 1 <= level_choice <= 3:
-                tutorial_level = ["full", "basic", "minimal"][level_choice-1]
-                break
-            else:
-                print("❌ Invalid choice. Please try again.")
-        except ValueError:
-            print("❌ Please enter a valid number.")
+    level_choice = InputUtils.prompt_int("\n🔢 Enter your choice (1-3, default: 1): ", 1, 3, 1, display_manager)
+    tutorial_level = ["full", "basic", "minimal"][level_choice-1]
     
     # Enter player name
-    player_name = input("\n✍️ Enter your name: ").strip()
+    player_name = InputUtils.read_line("\n✍️ Enter your name: ")
     if not player_name:
         player_name = "Player"
     
@@ -2741,7 +3042,7 @@ def main():
     
     ai_names = []
     for i in range(1, num_players):
-        ai_name = input(f"AI Player {i}: ").strip()
+        ai_name = InputUtils.read_line(f"AI Player {i}: ")
         if ai_name:
             ai_names.append(ai_name)
         else: